@@ -5,7 +5,7 @@ information into Telegram-friendly Markdown messages with proper escaping
 and visual formatting using emojis.
 """
 
-from typing import List
+from typing import Iterable, Sequence
 
 from app.protocols.base import Position, CollateralAsset, DebtAsset
 from app.core.health import (
@@ -195,7 +195,7 @@ def format_debt_asset(asset: DebtAsset) -> str:
     return line
 
 
-def format_collateral_assets(assets: List[CollateralAsset]) -> str:
+def format_collateral_assets(assets: Sequence[CollateralAsset]) -> str:
     """Format list of collateral assets for display."""
     if not assets:
         return "_No collateral assets_"
@@ -207,7 +207,7 @@ def format_collateral_assets(assets: List[CollateralAsset]) -> str:
     return "\n".join(lines)
 
 
-def format_debt_assets(assets: List[DebtAsset]) -> str:
+def format_debt_assets(assets: Sequence[DebtAsset]) -> str:
     """Format list of debt assets for display."""
     if not assets:
         return "_No debt_"
@@ -377,7 +377,7 @@ def format_unified_health_score(unified: UnifiedHealthScore) -> str:
     return msg
 
 
-def format_simulation_results(simulations: List[PriceSimulation]) -> str:
+def format_simulation_results(simulations: Iterable[PriceSimulation]) -> str:
     lines = ["*Price Impact Simulation*\n"]
 
     for sim in simulations:
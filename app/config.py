@@ -26,6 +26,12 @@ class Settings(BaseSettings):
         default=None, description="Optimism RPC URL (optional, falls back to ethereum_rpc_url)"
     )
 
+    # Optional local node IPC sockets; when set, adapters use IPC instead of HTTP for that chain
+    ethereum_ipc_path: str | None = Field(default=None, description="Ethereum node IPC socket path")
+    arbitrum_ipc_path: str | None = Field(default=None, description="Arbitrum node IPC socket path")
+    base_ipc_path: str | None = Field(default=None, description="Base node IPC socket path")
+    optimism_ipc_path: str | None = Field(default=None, description="Optimism node IPC socket path")
+
     # Legacy alias for backward compatibility - use ETHEREUM_RPC_URL instead
     rpc_url: str | None = Field(
         default=None, description="[DEPRECATED] Legacy RPC URL, use ETHEREUM_RPC_URL instead"
@@ -50,6 +56,10 @@ class Settings(BaseSettings):
         chain_url = getattr(self, f"{chain}_rpc_url", None)
         return chain_url or self.ethereum_rpc_url
 
+    def get_ipc_path(self, chain: str) -> str | None:
+        """Get the IPC socket path for a specific chain (no fallback across chains)."""
+        return getattr(self, f"{chain.lower()}_ipc_path", None)
+
     database_url: str = Field(
         default="sqlite+aiosqlite:///./liquidation_alerter.db",
         description="Database connection URL",
@@ -63,6 +73,9 @@ class Settings(BaseSettings):
     critical_health_factor_threshold: float = Field(
         default=1.1, description="Critical health factor threshold for urgent alerts"
     )
+    rpc_max_concurrency: int = Field(
+        default=20, description="Max in-flight RPC requests per protocol adapter"
+    )
     metrics_port: int = Field(
         default=8080, description="Port for Prometheus metrics endpoint"
     )
@@ -5,11 +5,14 @@ including smart cooldown periods, gas cost awareness, and rapid health
 factor deterioration detection to prevent spam while ensuring timely alerts.
 """
 
+import asyncio
 import logging
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Dict
-from collections import deque
+import sys
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List
 
 from telegram import Bot
 
@@ -21,42 +24,69 @@ from app.services.cache import make_position_key
 logger = logging.getLogger(__name__)
 
 
+# ETH per gwei of gas price for a typical DeFi transaction (~200k gas)
+_GAS_UNIT_COST = 200_000 * 1e-9
+
+
 @dataclass
 class AlertRecord:
     status: HealthStatus
     health_factor: float
-    last_alert_time: datetime
+    last_alert_time: float  # time.monotonic() seconds
     alert_count: int
 
 
-@dataclass
 class HealthHistory:
-    """Track health factor history for deterioration detection."""
-    timestamps: deque = field(default_factory=lambda: deque(maxlen=60))
-    health_factors: deque = field(default_factory=lambda: deque(maxlen=60))
+    """Track health factor history for deterioration detection.
+
+    Samples live in two preallocated ring buffers (health factor and
+    monotonic seconds), so adding a sample never allocates once the history
+    is created.
+    """
+
+    def __init__(self, maxlen: int = 60):
+        self._maxlen = maxlen
+        self._hf = [0.0] * maxlen
+        self._ts = [0.0] * maxlen
+        self._head = 0  # Next slot to write
+        self._size = 0
+
+    def _slot(self, i: int) -> int:
+        """Buffer slot of the i-th retained sample (0 = oldest)."""
+        return (self._head - self._size + i) % self._maxlen
+
+    @property
+    def health_factors(self) -> list[float]:
+        return [self._hf[self._slot(i)] for i in range(self._size)]
+
+    @property
+    def timestamps(self) -> list[float]:
+        return [self._ts[self._slot(i)] for i in range(self._size)]
 
-    def add(self, hf: float):
-        self.timestamps.append(datetime.utcnow())
-        self.health_factors.append(hf)
+    def add(self, hf: float, timestamp: float | None = None):
+        self._hf[self._head] = hf
+        self._ts[self._head] = time.monotonic() if timestamp is None else timestamp
+        self._head = (self._head + 1) % self._maxlen
+        self._size = min(self._size + 1, self._maxlen)
 
     def get_deterioration_rate(self, window_minutes: int = 60) -> float | None:
         """Calculate HF deterioration rate over the window period."""
-        if len(self.health_factors) < 2:
+        if self._size < 2:
             return None
 
-        cutoff = datetime.utcnow() - timedelta(minutes=window_minutes)
-        old_hf = None
-
-        for i, (ts, hf) in enumerate(zip(self.timestamps, self.health_factors)):
-            if ts >= cutoff:
-                if i > 0:
-                    old_hf = self.health_factors[i - 1]
-                break
+        # First sample inside the window; the one before it is the baseline
+        cutoff = time.monotonic() - window_minutes * 60
+        first_in_window = bisect_left(
+            range(self._size), cutoff, key=lambda i: self._ts[self._slot(i)]
+        )
+        if first_in_window == 0 or first_in_window == self._size:
+            return None
 
-        if old_hf is None or old_hf == 0:
+        old_hf = self._hf[self._slot(first_in_window - 1)]
+        if old_hf == 0:
             return None
 
-        current_hf = self.health_factors[-1]
+        current_hf = self._hf[self._slot(self._size - 1)]
         deterioration_pct = ((old_hf - current_hf) / old_hf) * 100
 
         return deterioration_pct
@@ -72,11 +102,11 @@ class GasAwareAlerter:
     - Smart cooldown periods based on severity
     """
 
-    COOLDOWN_PERIODS = {
-        HealthStatus.LIQUIDATABLE: timedelta(minutes=5),
-        HealthStatus.CRITICAL: timedelta(minutes=15),
-        HealthStatus.WARNING: timedelta(hours=1),
-        HealthStatus.HEALTHY: timedelta(hours=24),
+    COOLDOWN_PERIODS = {  # seconds
+        HealthStatus.LIQUIDATABLE: 5 * 60,
+        HealthStatus.CRITICAL: 15 * 60,
+        HealthStatus.WARNING: 60 * 60,
+        HealthStatus.HEALTHY: 24 * 60 * 60,
     }
 
     # Minimum position value to alert based on gas costs
@@ -86,18 +116,47 @@ class GasAwareAlerter:
     # Rapid deterioration threshold
     DETERIORATION_THRESHOLD_PERCENT = 10.0
 
+    # Maximum in-flight alert sends in check_and_alert_many
+    MAX_CONCURRENT_ALERTS = 32
+
+    # Identical checks within this window (e.g. overlapping pollers) are dropped
+    DEDUP_TTL_SECONDS = 5.0
+    DEDUP_MAX_ENTRIES = 10_000
+
     def __init__(self, bot: Bot):
         self._bot = bot
-        self._alert_history: Dict[str, AlertRecord] = {}
+        self._send_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ALERTS)
+        self._dedup: Dict[tuple, float] = {}  # fingerprint -> expiry (monotonic)
+        # chat_id -> (wallet, protocol) -> record, so per-chat clears never
+        # have to scan other users' entries
+        self._alert_history: Dict[int, Dict[tuple[str, str], AlertRecord]] = defaultdict(dict)
         self._health_history: Dict[str, HealthHistory] = {}
 
-    def _get_alert_key(self, chat_id: int, wallet_address: str, protocol: str) -> str:
+    def _get_alert_key(
+        self, chat_id: int, wallet_address: str, protocol: str
+    ) -> tuple[int, tuple[str, str]]:
         """Generate key for alert history (includes chat_id for per-user tracking)."""
-        return f"{chat_id}:{make_position_key(wallet_address, protocol)}"
+        # Protocol names come from a small fixed set; interning keeps key
+        # comparisons on the identity fast path
+        return chat_id, (wallet_address.lower(), sys.intern(protocol))
+
+    def _is_duplicate(self, fingerprint: tuple) -> bool:
+        """Return True if fingerprint was seen within DEDUP_TTL_SECONDS, else record it."""
+        now = time.monotonic()
+        expiry = self._dedup.get(fingerprint)
+        if expiry is not None and now < expiry:
+            return True
+
+        if len(self._dedup) > self.DEDUP_MAX_ENTRIES:
+            self._dedup = {
+                key: expiry for key, expiry in self._dedup.items() if expiry > now
+            }
+        self._dedup[fingerprint] = now + self.DEDUP_TTL_SECONDS
+        return False
 
     def _should_alert(
         self,
-        key: str,
+        key: tuple[int, tuple[str, str]],
         current_status: HealthStatus,
         current_hf: float,
     ) -> tuple[bool, str | None]:
@@ -105,10 +164,12 @@ class GasAwareAlerter:
         Determine if we should send an alert.
         Returns (should_alert, reason)
         """
-        if key not in self._alert_history:
+        chat_id, position_key = key
+        chat_history = self._alert_history.get(chat_id)
+        record = chat_history.get(position_key) if chat_history else None
+        if record is None:
             return True, "first_alert"
 
-        record = self._alert_history[key]
         cooldown = self.COOLDOWN_PERIODS[current_status]
 
         # Status priority for comparison
@@ -130,8 +191,7 @@ class GasAwareAlerter:
                 return True, "significant_hf_drop"
 
         # Check cooldown period
-        time_since_last = datetime.utcnow() - record.last_alert_time
-        if time_since_last >= cooldown:
+        if time.monotonic() - record.last_alert_time >= cooldown:
             return True, "cooldown_expired"
 
         return False, None
@@ -175,21 +235,17 @@ class GasAwareAlerter:
         if gas_price_gwei is None or eth_price_usd is None:
             return True, None  # Can't determine, assume OK
 
-        # Estimate gas cost for a typical DeFi transaction (~200k gas)
-        estimated_gas_units = 200_000
-        gas_cost_eth = (gas_price_gwei * estimated_gas_units) / 1e9
-        gas_cost_usd = gas_cost_eth * eth_price_usd
+        gas_cost_usd = gas_price_gwei * eth_price_usd * _GAS_UNIT_COST
 
         # Check if gas cost is too high relative to position value
-        if position.total_collateral_usd > 0:
-            gas_to_position_ratio = (gas_cost_usd / position.total_collateral_usd) * 100
-
-            if gas_to_position_ratio > self.GAS_COST_THRESHOLD_PERCENT:
-                logger.info(
-                    f"Gas cost ${gas_cost_usd:.2f} is {gas_to_position_ratio:.1f}% "
-                    f"of position value ${position.total_collateral_usd:.2f}"
-                )
-                return False, gas_cost_usd
+        # (cross-multiplied to avoid dividing on the common, economical path)
+        collateral_usd = position.total_collateral_usd
+        if collateral_usd > 0 and gas_cost_usd * 100 > collateral_usd * self.GAS_COST_THRESHOLD_PERCENT:
+            logger.info(
+                f"Gas cost ${gas_cost_usd:.2f} is {gas_cost_usd / collateral_usd * 100:.1f}% "
+                f"of position value ${collateral_usd:.2f}"
+            )
+            return False, gas_cost_usd
 
         return True, gas_cost_usd
 
@@ -205,6 +261,8 @@ class GasAwareAlerter:
         Check if alert should be sent and send it.
         Includes gas awareness and deterioration detection.
         """
+        key = self._get_alert_key(chat_id, position.wallet_address, position.protocol)
+
         # Don't alert for healthy positions (unless rapid deterioration)
         rapid_deterioration = self._check_rapid_deterioration(
             position.wallet_address,
@@ -215,7 +273,10 @@ class GasAwareAlerter:
         if assessment.status == HealthStatus.HEALTHY and not rapid_deterioration:
             return False
 
-        key = self._get_alert_key(chat_id, position.wallet_address, position.protocol)
+        # Checked after the history update so duplicates still record their sample
+        fingerprint = (key, assessment.status, round(position.health_factor, 2))
+        if self._is_duplicate(fingerprint):
+            return False
 
         should_alert, reason = self._should_alert(
             key, assessment.status, position.health_factor
@@ -256,16 +317,13 @@ class GasAwareAlerter:
             )
 
             # Update alert history
-            self._alert_history[key] = AlertRecord(
+            chat_history = self._alert_history[chat_id]
+            previous = chat_history.get(key[1])
+            chat_history[key[1]] = AlertRecord(
                 status=assessment.status,
                 health_factor=position.health_factor,
-                last_alert_time=datetime.utcnow(),
-                alert_count=self._alert_history.get(key, AlertRecord(
-                    status=assessment.status,
-                    health_factor=position.health_factor,
-                    last_alert_time=datetime.utcnow(),
-                    alert_count=0,
-                )).alert_count + 1,
+                last_alert_time=time.monotonic(),
+                alert_count=(previous.alert_count if previous else 0) + 1,
             )
 
             logger.info(
@@ -276,19 +334,45 @@ class GasAwareAlerter:
 
         except Exception as e:
             logger.error(f"Failed to send alert: {e}")
+            # Let the next check retry instead of treating it as a duplicate
+            self._dedup.pop(fingerprint, None)
             return False
 
+    async def check_and_alert_many(
+        self,
+        items: Iterable[tuple[int, Position, HealthAssessment]],
+        gas_price_gwei: float | None = None,
+        eth_price_usd: float | None = None,
+    ) -> List[bool]:
+        """
+        Run check_and_alert for many (chat_id, position, assessment) items concurrently.
+        At most MAX_CONCURRENT_ALERTS sends are in flight; results keep input order.
+        """
+        async def check_one(chat_id: int, position: Position, assessment: HealthAssessment) -> bool:
+            async with self._send_semaphore:
+                return await self.check_and_alert(
+                    chat_id,
+                    position,
+                    assessment,
+                    gas_price_gwei=gas_price_gwei,
+                    eth_price_usd=eth_price_usd,
+                )
+
+        return await asyncio.gather(*(check_one(*item) for item in items))
+
     def clear_alert_history(self, chat_id: int, wallet_address: str | None = None):
         """Clear alert history for a user."""
-        keys_to_remove = []
-        for key in self._alert_history:
-            parts = key.split(":")
-            if int(parts[0]) == chat_id:
-                if wallet_address is None or parts[1] == wallet_address:
-                    keys_to_remove.append(key)
-
-        for key in keys_to_remove:
-            del self._alert_history[key]
+        if wallet_address is None:
+            self._alert_history.pop(chat_id, None)
+            return
+
+        chat_history = self._alert_history.get(chat_id)
+        if not chat_history:
+            return
+
+        wallet = wallet_address.lower()
+        for position_key in [k for k in chat_history if k[0] == wallet]:
+            del chat_history[position_key]
 
     def get_deterioration_rate(
         self,
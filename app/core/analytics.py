@@ -4,9 +4,11 @@ This module provides simulation and stress testing capabilities for DeFi
 positions, including price impact analysis and liquidation risk prediction.
 """
 
+from array import array
 from dataclasses import dataclass
-from typing import List
+from typing import Iterator, List
 
+from app.core.health import calculate_price_drop_to_liquidation
 from app.protocols.base import Position
 
 
@@ -18,6 +20,37 @@ class PriceSimulation:
     collateral_at_risk_usd: float
 
 
+@dataclass
+class StressResult:
+    """Stress test results stored column-wise, one entry per scenario.
+
+    Iterating yields PriceSimulation rows for callers that want per-scenario
+    objects; aggregations can read the columns directly.
+    """
+
+    price_change_percent: array
+    new_health_factor: array
+    would_liquidate: tuple[bool, ...]
+    collateral_usd: float
+
+    def __len__(self) -> int:
+        return len(self.price_change_percent)
+
+    def __iter__(self) -> Iterator[PriceSimulation]:
+        for change, new_hf, would_liquidate in zip(
+            self.price_change_percent, self.new_health_factor, self.would_liquidate
+        ):
+            yield PriceSimulation(
+                price_change_percent=change,
+                new_health_factor=new_hf,
+                would_liquidate=would_liquidate,
+                collateral_at_risk_usd=self.collateral_usd if would_liquidate else 0.0,
+            )
+
+    def to_list(self) -> List[PriceSimulation]:
+        return list(self)
+
+
 @dataclass
 class LiquidationPrediction:
     price_drop_to_liquidation_percent: float | None
@@ -25,18 +58,23 @@ class LiquidationPrediction:
     risk_level: str
 
 
+# Stress scenarios (percent price change) and their collateral multipliers
+_STRESS_SCENARIOS = (-5, -10, -15, -20, -25, -30, -40, -50)
+_STRESS_MULTIPLIERS = tuple(1 + change / 100 for change in _STRESS_SCENARIOS)
+
+
+def _compute_hf(position: Position, multiplier: float) -> float:
+    """Health factor after scaling collateral value by ``multiplier``."""
+    if position.total_debt_usd > 0:
+        return position.total_collateral_usd * multiplier * position.hf_coefficient
+    return float("inf")
+
+
 def simulate_price_impact(
     position: Position,
     price_change_percent: float,
 ) -> PriceSimulation:
-    # Simulate collateral value change
-    new_collateral = position.total_collateral_usd * (1 + price_change_percent / 100)
-
-    # Calculate new health factor
-    if position.total_debt_usd > 0:
-        new_hf = (new_collateral * position.liquidation_threshold) / position.total_debt_usd
-    else:
-        new_hf = float("inf")
+    new_hf = _compute_hf(position, 1 + price_change_percent / 100)
 
     would_liquidate = new_hf <= 1.0
     collateral_at_risk = position.total_collateral_usd if would_liquidate else 0.0
@@ -50,21 +88,8 @@ def simulate_price_impact(
 
 
 def calculate_liquidation_price_drop(position: Position) -> float | None:
-    if position.total_debt_usd == 0 or position.health_factor == float("inf"):
-        return None
-
-    # Find price drop % that would bring HF to 1.0
-    # HF = (collateral * (1 + change) * threshold) / debt = 1.0
-    # collateral * (1 + change) * threshold = debt
-    # (1 + change) = debt / (collateral * threshold)
-    # change = (debt / (collateral * threshold)) - 1
-    current_hf_factor = (
-        position.total_collateral_usd * position.liquidation_threshold
-    ) / position.total_debt_usd
-
-    # The price drop needed is: 1 - (1 / current_hf_factor)
-    price_drop = (1 - (1 / current_hf_factor)) * 100
-    return max(0, price_drop)
+    # Same closed form as the health assessment; kept as the analytics entry point
+    return calculate_price_drop_to_liquidation(position)
 
 
 def predict_liquidation(
@@ -103,6 +128,19 @@ def predict_liquidation(
     )
 
 
-def run_stress_test(position: Position) -> List[PriceSimulation]:
-    scenarios = [-5, -10, -15, -20, -25, -30, -40, -50]
-    return [simulate_price_impact(position, change) for change in scenarios]
+def run_stress_test(position: Position) -> StressResult:
+    collateral = position.total_collateral_usd
+
+    if position.total_debt_usd > 0:
+        # Scale once; each scenario is then a single multiply
+        hf_per_unit = collateral * position.hf_coefficient
+        new_hfs = array("d", (hf_per_unit * m for m in _STRESS_MULTIPLIERS))
+    else:
+        new_hfs = array("d", [float("inf")] * len(_STRESS_SCENARIOS))
+
+    return StressResult(
+        price_change_percent=array("d", _STRESS_SCENARIOS),
+        new_health_factor=new_hfs,
+        would_liquidate=tuple(hf <= 1.0 for hf in new_hfs),
+        collateral_usd=collateral,
+    )
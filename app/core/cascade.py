@@ -7,10 +7,11 @@ where multiple liquidations in a short time could indicate systemic risk.
 
 import asyncio
 import logging
-from collections import defaultdict
+from array import array
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Deque, Dict, Iterable, List
 
 from web3 import AsyncWeb3
 
@@ -76,10 +77,19 @@ class LiquidationCascadeDetector:
 
     TIME_WINDOW_MINUTES = 60
 
+    # Per-protocol cap on retained events, bounding memory during bursts
+    MAX_RECENT_EVENTS = 1000
+
     def __init__(self):
         self._web3_provider = get_web3_provider()
-        self._recent_liquidations: Dict[str, List[LiquidationEvent]] = defaultdict(list)
-        self._last_checked_block: Dict[str, int] = {}
+        self._recent_liquidations: Dict[str, Deque[LiquidationEvent]] = defaultdict(
+            lambda: deque(maxlen=self.MAX_RECENT_EVENTS)
+        )
+        # Sum of debt_covered_usd over each protocol's retained events
+        self._running_value_usd: Dict[str, float] = defaultdict(float)
+        # Last polled block per protocol, indexed by position in LIQUIDATION_EVENTS
+        # (0 = not checked yet)
+        self._last_checked_block = array("q", [0] * len(LIQUIDATION_EVENTS))
         self._alert_history: Dict[str, datetime] = {}
         self._alert_cooldown = timedelta(minutes=30)
 
@@ -87,9 +97,9 @@ class LiquidationCascadeDetector:
         """Check all protocols for liquidation cascades."""
         alerts = []
 
-        for protocol, config in LIQUIDATION_EVENTS.items():
+        for index, (protocol, config) in enumerate(LIQUIDATION_EVENTS.items()):
             try:
-                cascade_alert = await self._check_protocol(protocol, config)
+                cascade_alert = await self._check_protocol(index, protocol, config)
                 if cascade_alert:
                     alerts.append(cascade_alert)
             except Exception as e:
@@ -99,6 +109,7 @@ class LiquidationCascadeDetector:
 
     async def _check_protocol(
         self,
+        index: int,
         protocol: str,
         config: dict,
     ) -> CascadeAlert | None:
@@ -111,10 +122,7 @@ class LiquidationCascadeDetector:
 
             # Determine starting block (look back ~1 hour, ~300 blocks at 12s/block)
             blocks_per_hour = 300
-            start_block = self._last_checked_block.get(
-                protocol,
-                current_block - blocks_per_hour,
-            )
+            start_block = self._last_checked_block[index] or current_block - blocks_per_hour
 
             if current_block <= start_block:
                 return None
@@ -128,16 +136,15 @@ class LiquidationCascadeDetector:
                 current_block,
             )
 
-            # Parse and store events
+            # Parse and store events (also expires events outside the window)
+            liquidations = []
             for event in events:
                 liquidation = self._parse_liquidation_event(protocol, event)
                 if liquidation:
-                    self._recent_liquidations[protocol].append(liquidation)
+                    liquidations.append(liquidation)
+            self.add_events(protocol, liquidations)
 
-            self._last_checked_block[protocol] = current_block
-
-            # Clean up old events
-            self._cleanup_old_events(protocol)
+            self._last_checked_block[index] = current_block
 
             # Check for cascade
             return self._detect_cascade(protocol)
@@ -208,13 +215,34 @@ class LiquidationCascadeDetector:
             logger.error(f"Error parsing liquidation event: {e}")
             return None
 
+    def add_events(self, protocol: str, events: Iterable[LiquidationEvent]):
+        """Record a batch of liquidation events, then expire old ones in one pass."""
+        recent = self._recent_liquidations[protocol]
+        batch = list(events)[-recent.maxlen:]
+
+        # Evict explicitly so dropped events leave the running value total
+        for _ in range(len(recent) + len(batch) - recent.maxlen):
+            self._running_value_usd[protocol] -= recent.popleft().debt_covered_usd
+
+        recent.extend(batch)
+        self._running_value_usd[protocol] += sum(e.debt_covered_usd for e in batch)
+        self._cleanup_old_events(protocol)
+
+    def add_event(self, protocol: str, event: LiquidationEvent):
+        """Record a single liquidation event."""
+        self.add_events(protocol, (event,))
+
     def _cleanup_old_events(self, protocol: str):
         """Remove events older than the time window."""
         cutoff = datetime.utcnow() - timedelta(minutes=self.TIME_WINDOW_MINUTES)
-        self._recent_liquidations[protocol] = [
-            e for e in self._recent_liquidations[protocol]
-            if e.timestamp >= cutoff
-        ]
+        events = self._recent_liquidations[protocol]
+        # Events are appended in arrival order, so expired ones sit at the front
+        while events and events[0].timestamp < cutoff:
+            self._running_value_usd[protocol] -= events.popleft().debt_covered_usd
+
+        if not events:
+            # Drop any accumulated float error once the window is empty
+            self._running_value_usd[protocol] = 0.0
 
     def _detect_cascade(self, protocol: str) -> CascadeAlert | None:
         """Detect if current liquidations constitute a cascade."""
@@ -224,7 +252,7 @@ class LiquidationCascadeDetector:
             return None
 
         count = len(events)
-        total_value = sum(e.debt_covered_usd for e in events)
+        total_value = self._running_value_usd[protocol]
         affected = list(set(e.borrower for e in events))
 
         # Determine severity
@@ -262,14 +290,14 @@ class LiquidationCascadeDetector:
 
     def get_recent_liquidations(self, protocol: str) -> List[LiquidationEvent]:
         """Get recent liquidations for a protocol."""
-        return self._recent_liquidations.get(protocol, [])
+        return list(self._recent_liquidations.get(protocol, ()))
 
     def get_stats(self) -> dict:
         """Get cascade detection statistics."""
         return {
             protocol: {
                 "recent_count": len(events),
-                "total_value_usd": sum(e.debt_covered_usd for e in events),
+                "total_value_usd": self._running_value_usd[protocol],
             }
             for protocol, events in self._recent_liquidations.items()
         }
@@ -257,8 +257,8 @@ class MonitoringEngine:
                         protocol=f"Aave V3 ({chain.capitalize()})",
                         wallet_address=wallet,
                         health_factor=data["health_factor"],
-                        collateral_assets=[],
-                        debt_assets=[],
+                        collateral_assets=(),
+                        debt_assets=(),
                         total_collateral_usd=data["total_collateral_base"],
                         total_debt_usd=data["total_debt_base"],
                         liquidation_threshold=data["liquidation_threshold"],
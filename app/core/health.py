@@ -7,7 +7,9 @@ actionable recommendations for users to manage their positions.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Mapping, Tuple
 
 from app.protocols.base import Position
 
@@ -41,7 +43,7 @@ class HealthAssessment:
     max_additional_borrow_usd: float | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UnifiedHealthScore:
     """Cross-protocol unified risk score."""
     overall_score: float  # 0-100 (100 = safest)
@@ -50,20 +52,33 @@ class UnifiedHealthScore:
     total_debt_usd: float
     weighted_health_factor: float
     worst_position: Position | None
-    positions: List[Position]
-    protocol_breakdown: dict  # protocol -> health_factor
+    positions: Tuple[Position, ...]
+    protocol_breakdown: Mapping[str, float]  # protocol -> health_factor
+
+
+# Shared result for wallets with no positions (immutable, so safe to reuse)
+_EMPTY_UNIFIED = UnifiedHealthScore(
+    overall_score=100.0,
+    overall_status=HealthStatus.HEALTHY,
+    total_collateral_usd=0.0,
+    total_debt_usd=0.0,
+    weighted_health_factor=float("inf"),
+    worst_position=None,
+    positions=(),
+    protocol_breakdown=MappingProxyType({}),
+)
 
 
 def calculate_normalized_score(health_factor: float) -> float:
     """Convert health factor to 0-100 score."""
-    if health_factor == float("inf") or health_factor > 10:
+    if health_factor > 10.0:  # Also covers inf
         return 100.0
     if health_factor <= 1.0:
         return 0.0
-    # Map HF 1.0-2.0 to score 0-80, HF 2.0-10.0 to score 80-100
+    # Map HF 1.0-2.0 to score 0-80, HF 2.0-10.0 to score 80-100 (20/8 = 2.5)
     if health_factor <= 2.0:
         return (health_factor - 1.0) * 80.0
-    return 80.0 + ((health_factor - 2.0) / 8.0) * 20.0
+    return 80.0 + (health_factor - 2.0) * 2.5
 
 
 def assess_health(
@@ -167,48 +182,41 @@ def calculate_unified_health_score(positions: List[Position]) -> UnifiedHealthSc
     - Total exposure across all protocols
     """
     if not positions:
-        return UnifiedHealthScore(
-            overall_score=100.0,
-            overall_status=HealthStatus.HEALTHY,
-            total_collateral_usd=0.0,
-            total_debt_usd=0.0,
-            weighted_health_factor=float("inf"),
-            worst_position=None,
-            positions=[],
-            protocol_breakdown={},
-        )
-
-    total_collateral = sum(p.total_collateral_usd for p in positions)
-    total_debt = sum(p.total_debt_usd for p in positions)
-
-    # Calculate weighted health factor by debt
+        return _EMPTY_UNIFIED
+
+    # Single pass over positions for totals, weighted HF and worst position
+    inf = float("inf")
+    total_collateral = 0.0
+    total_debt = 0.0
     weighted_hf_sum = 0.0
     weight_sum = 0.0
-    min_hf = float("inf")
+    min_hf = inf
     worst_position = None
     protocol_breakdown = {}
 
     for position in positions:
-        if position.total_debt_usd > 0:
-            hf = position.health_factor
-            weight = position.total_debt_usd
+        hf = position.health_factor
+        debt = position.total_debt_usd
+        total_collateral += position.total_collateral_usd
+        total_debt += debt
 
+        if debt > 0:
             # Handle infinite HF
-            if hf != float("inf"):
-                weighted_hf_sum += hf * weight
-                weight_sum += weight
+            if hf != inf:
+                weighted_hf_sum += hf * debt
+                weight_sum += debt
 
             if hf < min_hf:
                 min_hf = hf
                 worst_position = position
 
-        protocol_breakdown[position.protocol] = position.health_factor
+        protocol_breakdown[position.protocol] = hf
 
     # Calculate weighted average HF
     if weight_sum > 0:
         weighted_hf = weighted_hf_sum / weight_sum
     else:
-        weighted_hf = float("inf")
+        weighted_hf = inf
 
     # Overall score is based on the WORST position (most conservative)
     # This ensures users are alerted about their riskiest position
@@ -231,49 +239,79 @@ def calculate_unified_health_score(positions: List[Position]) -> UnifiedHealthSc
         total_debt_usd=total_debt,
         weighted_health_factor=weighted_hf,
         worst_position=worst_position,
-        positions=positions,
-        protocol_breakdown=protocol_breakdown,
+        positions=tuple(positions),
+        protocol_breakdown=MappingProxyType(protocol_breakdown),
     )
 
 
-def calculate_repayment_for_target_hf(
-    position: Position,
-    target_hf: float = 1.5,
+@lru_cache(maxsize=1024)
+def _repayment_for_target_hf(
+    collateral_usd: float,
+    debt_usd: float,
+    liquidation_threshold: float,
+    health_factor: float,
+    target_hf: float,
 ) -> float:
-    """Calculate how much debt to repay to reach target health factor."""
-    if position.total_debt_usd == 0 or position.health_factor >= target_hf:
+    if debt_usd <= 0 or health_factor >= target_hf:
         return 0.0
 
     # HF = (collateral * threshold) / debt
     # target_hf = (collateral * threshold) / new_debt
     # new_debt = (collateral * threshold) / target_hf
-    max_debt = (
-        position.total_collateral_usd * position.liquidation_threshold
-    ) / target_hf
+    max_debt = (collateral_usd * liquidation_threshold) / target_hf
 
-    repayment = position.total_debt_usd - max_debt
+    repayment = debt_usd - max_debt
     return max(0.0, repayment)
 
 
-def calculate_deposit_for_target_hf(
-    position: Position,
-    target_hf: float = 1.5,
+@lru_cache(maxsize=1024)
+def _deposit_for_target_hf(
+    collateral_usd: float,
+    debt_usd: float,
+    liquidation_threshold: float,
+    health_factor: float,
+    target_hf: float,
 ) -> float:
-    """Calculate how much collateral to deposit to reach target health factor."""
-    if position.total_debt_usd == 0 or position.health_factor >= target_hf:
+    if debt_usd <= 0 or health_factor >= target_hf:
         return 0.0
 
     # HF = (collateral * threshold) / debt
     # target_hf = (new_collateral * threshold) / debt
     # new_collateral = (target_hf * debt) / threshold
-    required_collateral = (
-        target_hf * position.total_debt_usd
-    ) / position.liquidation_threshold
+    required_collateral = (target_hf * debt_usd) / liquidation_threshold
 
-    deposit = required_collateral - position.total_collateral_usd
+    deposit = required_collateral - collateral_usd
     return max(0.0, deposit)
 
 
+def calculate_repayment_for_target_hf(
+    position: Position,
+    target_hf: float = 1.5,
+) -> float:
+    """Calculate how much debt to repay to reach target health factor."""
+    return _repayment_for_target_hf(
+        position.total_collateral_usd,
+        position.total_debt_usd,
+        position.liquidation_threshold,
+        position.health_factor,
+        target_hf,
+    )
+
+
+def calculate_deposit_for_target_hf(
+    position: Position,
+    target_hf: float = 1.5,
+) -> float:
+    """Calculate how much collateral to deposit to reach target health factor."""
+    return _deposit_for_target_hf(
+        position.total_collateral_usd,
+        position.total_debt_usd,
+        position.liquidation_threshold,
+        position.health_factor,
+        target_hf,
+    )
+
+
 def calculate_safe_withdrawal(
     position: Position,
     target_health_factor: float = 1.5,
@@ -366,9 +404,8 @@ def calculate_price_drop_to_liquidation(
     # (1-drop) = debt / (collateral * threshold)
     # drop = 1 - debt / (collateral * threshold)
 
-    current_hf_factor = (
-        position.total_collateral_usd * position.liquidation_threshold
-    ) / position.total_debt_usd
+    current_hf_factor = position.total_collateral_usd * position.hf_coefficient
 
-    price_drop = (1 - (1 / current_hf_factor)) * 100
-    return max(0.0, price_drop)
+    # (1 - 1/x) * 100 folded to a single divide and subtract
+    price_drop = 100.0 - 100.0 / current_hf_factor
+    return price_drop if price_drop > 0.0 else 0.0
@@ -5,15 +5,17 @@ Ethereum, Arbitrum, Base, and Optimism. It fetches position data including
 per-asset collateral and debt breakdowns with APYs using the UiPoolDataProvider.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 
-from web3 import AsyncWeb3, AsyncHTTPProvider
-from web3.eth import AsyncEth
+from web3 import AsyncWeb3
 
 from app.protocols.base import ProtocolAdapter, Position, CollateralAsset, DebtAsset
 from app.config import get_settings
 from app.services.cache import get_position_cache
+from app.services.rpc import create_chain_web3
+from app.services.multicall import BatchPositionFetcher, MulticallService
 
 logger = logging.getLogger(__name__)
 
@@ -172,6 +174,11 @@ UI_POOL_DATA_PROVIDER_ABI = [
 
 
 class AaveV3Adapter(ProtocolAdapter):
+    # Max reads per JSON-RPC batch payload, to stay under node request size limits
+    BATCH_CHUNK_SIZE = 500
+    # Max getUserAccountData reads per Multicall3 aggregate3, to stay under the eth_call gas cap
+    MULTICALL_CHUNK_SIZE = 100
+
     def __init__(self, chain: str = "ethereum", web3: AsyncWeb3 | None = None):
         self._chain = chain.lower()
         if self._chain not in AAVE_V3_POOL_ADDRESSES:
@@ -179,16 +186,8 @@ class AaveV3Adapter(ProtocolAdapter):
 
         settings = get_settings()
 
-        # Get chain-specific RPC URL from settings
-        rpc_url = settings.get_rpc_url(self._chain)
-
-        if web3:
-            self._web3 = web3
-        else:
-            self._web3 = AsyncWeb3(
-                AsyncHTTPProvider(rpc_url),
-                modules={"eth": (AsyncEth,)},
-            )
+        # Chain-specific provider from settings (IPC socket if configured, else HTTP)
+        self._web3 = web3 or create_chain_web3(self._chain)
 
         pool_address = AAVE_V3_POOL_ADDRESSES[self._chain]
         self._pool_contract = self._web3.eth.contract(
@@ -207,6 +206,8 @@ class AaveV3Adapter(ProtocolAdapter):
             self._ui_data_provider = None
 
         self._position_cache = get_position_cache()
+        self._multicall = MulticallService(self._web3)
+        self._rpc_sem = asyncio.Semaphore(settings.rpc_max_concurrency)
 
     @property
     def name(self) -> str:
@@ -217,6 +218,16 @@ class AaveV3Adapter(ProtocolAdapter):
     def chain(self) -> str:
         return self._chain
 
+    async def _call(self, contract_fn):
+        """Run a contract read, bounded by the adapter's RPC concurrency limit."""
+        async with self._rpc_sem:
+            return await contract_fn.call()
+
+    async def _execute(self, batch):
+        """Send a JSON-RPC batch, bounded by the adapter's RPC concurrency limit."""
+        async with self._rpc_sem:
+            return await batch.async_execute()
+
     def _ray_to_percent(self, ray_value: int) -> float:
         """Convert ray (1e27) to decimal (e.g., 0.032 for 3.2% APY)."""
         return ray_value / 1e27
@@ -450,36 +461,148 @@ class AaveV3Adapter(ProtocolAdapter):
 
         try:
             checksum_address = AsyncWeb3.to_checksum_address(wallet_address)
-            data = await self._pool_contract.functions.getUserAccountData(
+            data = await self._call(self._pool_contract.functions.getUserAccountData(
                 checksum_address
-            ).call()
-
-            total_collateral_base = data[0] / 1e8  # Aave uses 8 decimals for base currency
-            total_debt_base = data[1] / 1e8
-            available_borrows_base = data[2] / 1e8
-            liquidation_threshold = data[3] / 1e4  # Percentage in basis points
-            health_factor = data[5] / 1e18 if data[5] < 2**255 else float("inf")
+            ))
+            return self._cache_basic_position(wallet_address, data)
+        except Exception:
+            return None
 
-            if total_collateral_base == 0 and total_debt_base == 0:
-                return None
+    async def get_position_bytes(self, wallet_address: bytes) -> Position | None:
+        """Get basic position data for a raw 20-byte address, skipping EIP-55 checksumming."""
+        wallet_hex = "0x" + wallet_address.hex()
+        cached = self._position_cache.get_basic(wallet_hex, self.name)
+        if cached is not None:
+            return cached
 
-            position = Position(
-                protocol=self.name,
-                wallet_address=wallet_address,
-                health_factor=health_factor,
-                collateral_assets=[],
-                debt_assets=[],
-                total_collateral_usd=total_collateral_base,
-                total_debt_usd=total_debt_base,
-                liquidation_threshold=liquidation_threshold,
-                available_borrows_usd=available_borrows_base,
-                chain=self._chain,
-            )
-            self._position_cache.set_basic(wallet_address, self.name, position)
-            return position
+        try:
+            data = await self._call(self._pool_contract.functions.getUserAccountData(wallet_address))
+            return self._cache_basic_position(wallet_hex, data)
         except Exception:
             return None
 
+    def _cache_basic_position(self, wallet_address: str, data) -> Position | None:
+        """Build a basic position from getUserAccountData output and cache it."""
+        total_collateral_base = data[0] / 1e8  # Aave uses 8 decimals for base currency
+        total_debt_base = data[1] / 1e8
+        available_borrows_base = data[2] / 1e8
+        liquidation_threshold = data[3] / 1e4  # Percentage in basis points
+        health_factor = data[5] / 1e18 if data[5] < 2**255 else float("inf")
+
+        if total_collateral_base == 0 and total_debt_base == 0:
+            return None
+
+        position = Position(
+            protocol=self.name,
+            wallet_address=wallet_address,
+            health_factor=health_factor,
+            collateral_assets=(),
+            debt_assets=(),
+            total_collateral_usd=total_collateral_base,
+            total_debt_usd=total_debt_base,
+            liquidation_threshold=liquidation_threshold,
+            available_borrows_usd=available_borrows_base,
+            chain=self._chain,
+        )
+        self._position_cache.set_basic(wallet_address, self.name, position)
+        return position
+
+    def _partition_cached(
+        self, wallet_addresses: List[str]
+    ) -> Tuple[List[Position | None], Dict[str, List[int]]]:
+        """Fill results from the position cache; map each uncached wallet to its indices."""
+        results: List[Position | None] = [None] * len(wallet_addresses)
+        pending: Dict[str, List[int]] = {}
+
+        for i, wallet in enumerate(wallet_addresses):
+            cached = self._position_cache.get_basic(wallet, self.name)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(wallet, []).append(i)
+
+        return results, pending
+
+    async def get_positions(self, wallet_addresses: List[str]) -> List[Position | None]:
+        """Get basic positions for many wallets through Multicall3 aggregate3.
+
+        Uncached wallets are read in a single eth_call per MULTICALL_CHUNK_SIZE
+        wallets. If an aggregate call fails outright (e.g. Multicall3 missing on
+        the chain), falls back to get_positions_batch.
+
+        Returns:
+            List of Position (or None) in the same order as wallet_addresses
+        """
+        results, pending = self._partition_cached(wallet_addresses)
+        wallets = list(pending)
+        pool_address = self._pool_contract.address
+
+        try:
+            for start in range(0, len(wallets), self.MULTICALL_CHUNK_SIZE):
+                chunk = wallets[start:start + self.MULTICALL_CHUNK_SIZE]
+                calls = [
+                    self._multicall.build_call(
+                        pool_address,
+                        "getUserAccountData(address)",
+                        ["address"],
+                        [AsyncWeb3.to_checksum_address(wallet)],
+                    )
+                    for wallet in chunk
+                ]
+                async with self._rpc_sem:
+                    call_results = await self._multicall.execute(calls)
+                if not any(result.success for result in call_results):
+                    raise RuntimeError("every call in the aggregate failed")
+
+                for wallet, call_result in zip(chunk, call_results):
+                    success, data = MulticallService.decode_result(
+                        call_result, BatchPositionFetcher.AAVE_OUTPUT_TYPES
+                    )
+                    position = self._cache_basic_position(wallet, data) if success else None
+                    for i in pending[wallet]:
+                        results[i] = position
+
+        except Exception as e:
+            logger.warning(f"Multicall position request failed on {self.name}, falling back: {e}")
+            return await self.get_positions_batch(wallet_addresses)
+
+        return results
+
+    async def get_positions_batch(self, wallet_addresses: List[str]) -> List[Position | None]:
+        """Get basic positions for many wallets using JSON-RPC batch requests.
+
+        Uncached wallets are read with one getUserAccountData call each, sent in
+        batches of up to BATCH_CHUNK_SIZE per HTTP request. If the provider rejects
+        batching, falls back to concurrent get_position calls.
+
+        Returns:
+            List of Position (or None) in the same order as wallet_addresses
+        """
+        results, pending = self._partition_cached(wallet_addresses)
+        wallets = list(pending)
+        try:
+            for start in range(0, len(wallets), self.BATCH_CHUNK_SIZE):
+                chunk = wallets[start:start + self.BATCH_CHUNK_SIZE]
+                async with self._web3.batch_requests() as batch:
+                    for wallet in chunk:
+                        batch.add(self._pool_contract.functions.getUserAccountData(
+                            AsyncWeb3.to_checksum_address(wallet)
+                        ))
+                    responses = await self._execute(batch)
+
+                for wallet, data in zip(chunk, responses):
+                    position = self._cache_basic_position(wallet, data)
+                    for i in pending[wallet]:
+                        results[i] = position
+
+        except Exception as e:
+            logger.warning(f"Batched position request failed on {self.name}, falling back: {e}")
+            return list(await asyncio.gather(
+                *(self.get_position(wallet) for wallet in wallet_addresses)
+            ))
+
+        return results
+
     async def get_detailed_position(self, wallet_address: str) -> Position | None:
         """Get detailed position with per-asset breakdown.
 
@@ -504,14 +627,14 @@ class AaveV3Adapter(ProtocolAdapter):
             provider_address = AAVE_V3_POOL_ADDRESSES_PROVIDER[self._chain]
 
             # Fetch reserves data (symbols, prices, APYs, thresholds)
-            reserves_data, base_currency_info = await self._ui_data_provider.functions.getReservesData(
+            reserves_data, base_currency_info = await self._call(self._ui_data_provider.functions.getReservesData(
                 provider_address
-            ).call()
+            ))
 
             # Fetch user's reserves data (balances, collateral flags)
-            user_reserves_data, _ = await self._ui_data_provider.functions.getUserReservesData(
+            user_reserves_data, _ = await self._call(self._ui_data_provider.functions.getUserReservesData(
                 provider_address, checksum_address
-            ).call()
+            ))
 
             # Build lookup map: asset_address -> reserve_info
             reserve_map = self._build_reserve_map(reserves_data, base_currency_info)
@@ -599,8 +722,8 @@ class AaveV3Adapter(ProtocolAdapter):
                 chain=self._chain,
                 wallet_address=wallet_address,
                 health_factor=health_factor,
-                collateral_assets=collateral_assets,
-                debt_assets=debt_assets,
+                collateral_assets=tuple(collateral_assets),
+                debt_assets=tuple(debt_assets),
                 total_collateral_usd=total_collateral_usd,
                 total_debt_usd=total_debt_usd,
                 liquidation_threshold=weighted_liq_threshold,
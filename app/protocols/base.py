@@ -7,11 +7,11 @@ and the data models for representing lending positions with collateral and debt.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Tuple
 
 
-@dataclass
+@dataclass(frozen=True)
 class Asset:
     """Base asset with balance and price information."""
     symbol: str
@@ -22,7 +22,7 @@ class Asset:
     decimals: int = 18          # Token decimals
 
 
-@dataclass
+@dataclass(frozen=True)
 class CollateralAsset(Asset):
     """Asset supplied as collateral in a lending position."""
     is_collateral_enabled: bool = True  # Whether used as collateral for borrows
@@ -31,7 +31,7 @@ class CollateralAsset(Asset):
     supply_apy: float | None = None     # Current supply APY (0.032 = 3.2%)
 
 
-@dataclass
+@dataclass(frozen=True)
 class DebtAsset(Asset):
     """Asset borrowed as debt in a lending position."""
     interest_rate_mode: str = "variable"       # "variable" or "stable"
@@ -40,20 +40,33 @@ class DebtAsset(Asset):
     accrued_interest: float | None = None      # Interest since last interaction
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Position:
     """Lending position with collateral and debt assets."""
     protocol: str
     wallet_address: str
     health_factor: float
-    collateral_assets: List[CollateralAsset]
-    debt_assets: List[DebtAsset]
     total_collateral_usd: float
     total_debt_usd: float
     liquidation_threshold: float  # Weighted average across collaterals
     available_borrows_usd: float
+    collateral_assets: Tuple[CollateralAsset, ...] = ()
+    debt_assets: Tuple[DebtAsset, ...] = ()
     chain: str = "ethereum"       # Chain name: "ethereum", "arbitrum", "base", "optimism"
     net_apy: float | None = None  # Net APY (supply - borrow weighted)
+    # liquidation_threshold / total_debt_usd (inf without debt), so that
+    # HF = collateral_usd * hf_coefficient; computed once at construction
+    hf_coefficient: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Callers may pass lists; store tuples so positions stay immutable and hashable
+        object.__setattr__(self, "collateral_assets", tuple(self.collateral_assets))
+        object.__setattr__(self, "debt_assets", tuple(self.debt_assets))
+        if self.total_debt_usd > 0:
+            coefficient = self.liquidation_threshold / self.total_debt_usd
+        else:
+            coefficient = float("inf")
+        object.__setattr__(self, "hf_coefficient", coefficient)
 
 
 class ProtocolAdapter(ABC):
@@ -74,6 +87,10 @@ class ProtocolAdapter(ABC):
         """Get basic position data (backward compatible)."""
         pass
 
+    async def get_position_bytes(self, wallet_address: bytes) -> Position | None:
+        """Get basic position data for a raw 20-byte address."""
+        return await self.get_position("0x" + wallet_address.hex())
+
     @abstractmethod
     async def get_detailed_position(self, wallet_address: str) -> Position | None:
         """Get detailed position with per-asset breakdown."""
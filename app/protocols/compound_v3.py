@@ -5,16 +5,18 @@ Ethereum, Arbitrum, Base, and Optimism. It fetches position data including
 per-asset collateral breakdowns, borrow rates, and supply APYs.
 """
 
+import asyncio
 import logging
 import math
-from typing import List
+from typing import Dict, Iterable, List, Tuple
 
-from web3 import AsyncWeb3, AsyncHTTPProvider
-from web3.eth import AsyncEth
+from web3 import AsyncWeb3
 
 from app.protocols.base import ProtocolAdapter, Position, CollateralAsset, DebtAsset
 from app.config import get_settings
 from app.services.cache import get_position_cache
+from app.services.rpc import create_chain_web3
+from app.services.multicall import MulticallService
 from app.services.token_metadata import get_token_metadata_service
 
 logger = logging.getLogger(__name__)
@@ -146,6 +148,14 @@ class CompoundV3Adapter(ProtocolAdapter):
     # Seconds per year for APY calculation
     SECONDS_PER_YEAR = 31536000
 
+    # Max reads per JSON-RPC batch payload, to stay under node request size limits
+    BATCH_CHUNK_SIZE = 500
+    # Max reads per Multicall3 aggregate3, to stay under the eth_call gas cap
+    MULTICALL_CHUNK_SIZE = 500
+
+    # getAssetInfo(uint8) return struct, as decoded from raw multicall return data
+    ASSET_INFO_TYPE = "(uint8,address,address,uint64,uint64,uint64,uint64,uint128)"
+
     def __init__(self, chain: str = "ethereum", web3: AsyncWeb3 | None = None, comet_address: str | None = None):
         self._chain = chain.lower()
         if self._chain not in COMPOUND_V3_COMET_ADDRESSES:
@@ -153,16 +163,8 @@ class CompoundV3Adapter(ProtocolAdapter):
 
         settings = get_settings()
 
-        # Get chain-specific RPC URL from settings
-        rpc_url = settings.get_rpc_url(self._chain)
-
-        if web3:
-            self._web3 = web3
-        else:
-            self._web3 = AsyncWeb3(
-                AsyncHTTPProvider(rpc_url),
-                modules={"eth": (AsyncEth,)},
-            )
+        # Chain-specific provider from settings (IPC socket if configured, else HTTP)
+        self._web3 = web3 or create_chain_web3(self._chain)
 
         self._comet_address = comet_address or COMPOUND_V3_COMET_ADDRESSES[self._chain]
         self._comet_contract = self._web3.eth.contract(
@@ -170,6 +172,8 @@ class CompoundV3Adapter(ProtocolAdapter):
             abi=COMET_ABI,
         )
         self._position_cache = get_position_cache()
+        self._multicall = MulticallService(self._web3)
+        self._rpc_sem = asyncio.Semaphore(settings.rpc_max_concurrency)
 
     @property
     def name(self) -> str:
@@ -180,6 +184,16 @@ class CompoundV3Adapter(ProtocolAdapter):
     def chain(self) -> str:
         return self._chain
 
+    async def _call(self, contract_fn):
+        """Run a contract read, bounded by the adapter's RPC concurrency limit."""
+        async with self._rpc_sem:
+            return await contract_fn.call()
+
+    async def _execute(self, batch):
+        """Send a JSON-RPC batch, bounded by the adapter's RPC concurrency limit."""
+        async with self._rpc_sem:
+            return await batch.async_execute()
+
     def _rate_to_apy(self, rate_per_second: int) -> float:
         """Convert per-second rate to APY.
 
@@ -205,68 +219,265 @@ class CompoundV3Adapter(ProtocolAdapter):
 
         try:
             checksum_address = AsyncWeb3.to_checksum_address(wallet_address)
+            return await self._fetch_position(wallet_address, checksum_address)
+        except Exception:
+            return None
 
-            # Get borrow balance (in base token - USDC)
-            borrow_balance = await self._comet_contract.functions.borrowBalanceOf(
-                checksum_address
-            ).call()
-            borrow_balance_usd = borrow_balance / 1e6  # USDC has 6 decimals
+    async def get_position_bytes(self, wallet_address: bytes) -> Position | None:
+        """Get basic position data for a raw 20-byte address, skipping EIP-55 checksumming."""
+        wallet_hex = "0x" + wallet_address.hex()
+        cached = self._position_cache.get_basic(wallet_hex, self.name)
+        if cached is not None:
+            return cached
 
-            # Get supply balance (base token)
-            supply_balance = await self._comet_contract.functions.balanceOf(
-                checksum_address
-            ).call()
-            supply_balance_usd = supply_balance / 1e6
+        try:
+            return await self._fetch_position(wallet_hex, wallet_address)
+        except Exception:
+            return None
 
-            # Get collateral balances and calculate total collateral value
-            num_assets = await self._comet_contract.functions.numAssets().call()
-            total_collateral_usd = 0.0
-            avg_liquidation_factor = 0.0
+    async def _fetch_position(self, wallet_address: str, account: str | bytes) -> Position | None:
+        """Read and cache a basic position; account is passed as-is to the contract calls."""
+        # Get borrow balance (in base token - USDC)
+        borrow_balance = await self._call(self._comet_contract.functions.borrowBalanceOf(account))
 
-            for i in range(num_assets):
-                asset_info = await self._comet_contract.functions.getAssetInfo(i).call()
-                asset_address = asset_info[1]
-                price_feed = asset_info[2]
+        # Get supply balance (base token)
+        supply_balance = await self._call(self._comet_contract.functions.balanceOf(account))
+
+        # Get collateral balances and their prices
+        num_assets = await self._call(self._comet_contract.functions.numAssets())
+        collateral = []
+
+        for i in range(num_assets):
+            asset_info = await self._call(self._comet_contract.functions.getAssetInfo(i))
+            collateral_balance = await self._call(self._comet_contract.functions.collateralBalanceOf(
+                account, asset_info[1]
+            ))
+
+            if collateral_balance > 0:
+                price = await self._call(self._comet_contract.functions.getPrice(asset_info[2]))
+                collateral.append((collateral_balance, price, asset_info))
+
+        return self._cache_basic_position(
+            wallet_address, borrow_balance, supply_balance, collateral
+        )
+
+    def _cache_basic_position(
+        self,
+        wallet_address: str,
+        borrow_balance: int,
+        supply_balance: int,
+        collateral: Iterable[Tuple[int, int, tuple]],
+    ) -> Position | None:
+        """Build a basic position from raw Comet reads and cache it.
+
+        collateral holds (collateral_balance, price, asset_info) per collateral asset.
+        """
+        borrow_balance_usd = borrow_balance / 1e6  # USDC has 6 decimals
+        supply_balance_usd = supply_balance / 1e6
+
+        total_collateral_usd = 0.0
+        avg_liquidation_factor = 0.0
+
+        for collateral_balance, price, asset_info in collateral:
+            if collateral_balance > 0:
                 scale = asset_info[3]
                 liquidate_collateral_factor = asset_info[5] / 1e18
+                # Price is in 8 decimals, scale converts to base units
+                collateral_value = (collateral_balance * price) / (scale * 1e8)
+                total_collateral_usd += collateral_value
+                avg_liquidation_factor = max(avg_liquidation_factor, liquidate_collateral_factor)
 
-                collateral_balance = await self._comet_contract.functions.collateralBalanceOf(
-                    checksum_address, asset_address
-                ).call()
+        if total_collateral_usd == 0 and borrow_balance_usd == 0 and supply_balance_usd == 0:
+            return None
 
-                if collateral_balance > 0:
-                    price = await self._comet_contract.functions.getPrice(price_feed).call()
-                    # Price is in 8 decimals, scale converts to base units
-                    collateral_value = (collateral_balance * price) / (scale * 1e8)
-                    total_collateral_usd += collateral_value
-                    avg_liquidation_factor = max(avg_liquidation_factor, liquidate_collateral_factor)
+        # Calculate health factor
+        # In Compound V3, health factor = (collateral * liquidation_factor) / debt
+        if borrow_balance_usd > 0 and avg_liquidation_factor > 0:
+            health_factor = (total_collateral_usd * avg_liquidation_factor) / borrow_balance_usd
+        else:
+            health_factor = float("inf")
+
+        position = Position(
+            protocol=self.name,
+            wallet_address=wallet_address,
+            health_factor=health_factor,
+            collateral_assets=(),
+            debt_assets=(),
+            total_collateral_usd=total_collateral_usd + supply_balance_usd,
+            total_debt_usd=borrow_balance_usd,
+            liquidation_threshold=avg_liquidation_factor,
+            available_borrows_usd=0.0,
+            chain=self._chain,
+        )
+        self._position_cache.set_basic(wallet_address, self.name, position)
+        return position
+
+    def _partition_cached(
+        self, wallet_addresses: List[str]
+    ) -> Tuple[List[Position | None], Dict[str, List[int]]]:
+        """Fill results from the position cache; map each uncached wallet to its indices."""
+        results: List[Position | None] = [None] * len(wallet_addresses)
+        pending: Dict[str, List[int]] = {}
+
+        for i, wallet in enumerate(wallet_addresses):
+            cached = self._position_cache.get_basic(wallet, self.name)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(wallet, []).append(i)
+
+        return results, pending
+
+    async def _aggregate(self, calls: list, output_types: List[str]) -> list:
+        """Run calls through one Multicall3 aggregate3; decoded values, or None per failed call."""
+        if not calls:
+            return []
+        async with self._rpc_sem:
+            call_results = await self._multicall.execute(calls)
+        if not any(result.success for result in call_results):
+            raise RuntimeError("every call in the aggregate failed")
+        return [
+            decoded[0] if success else None
+            for success, decoded in (
+                MulticallService.decode_result(result, output_types) for result in call_results
+            )
+        ]
 
-            if total_collateral_usd == 0 and borrow_balance_usd == 0 and supply_balance_usd == 0:
-                return None
+    async def get_positions(self, wallet_addresses: List[str]) -> List[Position | None]:
+        """Get basic positions for many wallets through Multicall3 aggregate3.
 
-            # Calculate health factor
-            # In Compound V3, health factor = (collateral * liquidation_factor) / debt
-            if borrow_balance_usd > 0 and avg_liquidation_factor > 0:
-                health_factor = (total_collateral_usd * avg_liquidation_factor) / borrow_balance_usd
-            else:
-                health_factor = float("inf")
+        Market-wide reads (asset list, then prices) take one aggregate call each;
+        per-wallet balances are bundled into aggregate calls of up to
+        MULTICALL_CHUNK_SIZE reads. If an aggregate call fails outright, falls
+        back to get_positions_batch.
 
-            position = Position(
-                protocol=self.name,
-                wallet_address=wallet_address,
-                health_factor=health_factor,
-                collateral_assets=[],
-                debt_assets=[],
-                total_collateral_usd=total_collateral_usd + supply_balance_usd,
-                total_debt_usd=borrow_balance_usd,
-                liquidation_threshold=avg_liquidation_factor,
-                available_borrows_usd=0.0,
-                chain=self._chain,
+        Returns:
+            List of Position (or None) in the same order as wallet_addresses
+        """
+        results, pending = self._partition_cached(wallet_addresses)
+        if not pending:
+            return results
+
+        wallets = list(pending)
+        comet = self._comet_address
+        build_call = self._multicall.build_call
+        try:
+            num_assets = await self._call(self._comet_contract.functions.numAssets())
+
+            asset_infos = await self._aggregate(
+                [build_call(comet, "getAssetInfo(uint8)", ["uint8"], [i]) for i in range(num_assets)],
+                [self.ASSET_INFO_TYPE],
             )
-            self._position_cache.set_basic(wallet_address, self.name, position)
-            return position
-        except Exception:
-            return None
+            prices = await self._aggregate(
+                [
+                    build_call(comet, "getPrice(address)", ["address"], [asset_info[2]])
+                    for asset_info in asset_infos
+                ],
+                ["uint256"],
+            )
+            if None in asset_infos or None in prices:
+                raise RuntimeError("market reads failed")
+
+            # borrowBalanceOf, balanceOf, then one collateralBalanceOf per asset
+            calls_per_wallet = 2 + num_assets
+            wallets_per_chunk = max(1, self.MULTICALL_CHUNK_SIZE // calls_per_wallet)
+
+            for start in range(0, len(wallets), wallets_per_chunk):
+                chunk = wallets[start:start + wallets_per_chunk]
+                calls = []
+                for wallet in chunk:
+                    checksum_address = AsyncWeb3.to_checksum_address(wallet)
+                    calls.append(build_call(comet, "borrowBalanceOf(address)", ["address"], [checksum_address]))
+                    calls.append(build_call(comet, "balanceOf(address)", ["address"], [checksum_address]))
+                    for asset_info in asset_infos:
+                        calls.append(build_call(
+                            comet,
+                            "collateralBalanceOf(address,address)",
+                            ["address", "address"],
+                            [checksum_address, asset_info[1]],
+                        ))
+                reads = await self._aggregate(calls, ["uint256"])
+
+                for n, wallet in enumerate(chunk):
+                    wallet_reads = reads[n * calls_per_wallet:(n + 1) * calls_per_wallet]
+                    if None in wallet_reads:
+                        position = None
+                    else:
+                        position = self._cache_basic_position(
+                            wallet,
+                            wallet_reads[0],
+                            wallet_reads[1],
+                            zip(wallet_reads[2:], prices, asset_infos),
+                        )
+                    for i in pending[wallet]:
+                        results[i] = position
+
+        except Exception as e:
+            logger.warning(f"Multicall position request failed on {self.name}, falling back: {e}")
+            return await self.get_positions_batch(wallet_addresses)
+
+        return results
+
+    async def get_positions_batch(self, wallet_addresses: List[str]) -> List[Position | None]:
+        """Get basic positions for many wallets using JSON-RPC batch requests.
+
+        Market-wide reads (asset list and prices) are fetched once; per-wallet
+        balances are sent in batches of up to BATCH_CHUNK_SIZE calls per HTTP
+        request. If the provider rejects batching, falls back to concurrent
+        get_position calls.
+
+        Returns:
+            List of Position (or None) in the same order as wallet_addresses
+        """
+        results, pending = self._partition_cached(wallet_addresses)
+        if not pending:
+            return results
+
+        wallets = list(pending)
+        functions = self._comet_contract.functions
+        try:
+            num_assets = await self._call(functions.numAssets())
+
+            async with self._web3.batch_requests() as batch:
+                for i in range(num_assets):
+                    batch.add(functions.getAssetInfo(i))
+                asset_infos = await self._execute(batch) if num_assets else []
+
+            async with self._web3.batch_requests() as batch:
+                for asset_info in asset_infos:
+                    batch.add(functions.getPrice(asset_info[2]))
+                prices = await self._execute(batch) if num_assets else []
+
+            # borrowBalanceOf, balanceOf, then one collateralBalanceOf per asset
+            calls_per_wallet = 2 + num_assets
+            wallets_per_chunk = max(1, self.BATCH_CHUNK_SIZE // calls_per_wallet)
+
+            for start in range(0, len(wallets), wallets_per_chunk):
+                chunk = wallets[start:start + wallets_per_chunk]
+                async with self._web3.batch_requests() as batch:
+                    for wallet in chunk:
+                        checksum_address = AsyncWeb3.to_checksum_address(wallet)
+                        batch.add(functions.borrowBalanceOf(checksum_address))
+                        batch.add(functions.balanceOf(checksum_address))
+                        for asset_info in asset_infos:
+                            batch.add(functions.collateralBalanceOf(checksum_address, asset_info[1]))
+                    responses = await self._execute(batch)
+
+                for n, wallet in enumerate(chunk):
+                    reads = responses[n * calls_per_wallet:(n + 1) * calls_per_wallet]
+                    position = self._cache_basic_position(
+                        wallet, reads[0], reads[1], zip(reads[2:], prices, asset_infos)
+                    )
+                    for i in pending[wallet]:
+                        results[i] = position
+
+        except Exception as e:
+            logger.warning(f"Batched position request failed on {self.name}, falling back: {e}")
+            return list(await asyncio.gather(
+                *(self.get_position(wallet) for wallet in wallet_addresses)
+            ))
+
+        return results
 
     async def get_detailed_position(self, wallet_address: str) -> Position | None:
         """Get detailed Compound V3 position with per-asset breakdown.
@@ -286,38 +497,38 @@ class CompoundV3Adapter(ProtocolAdapter):
             token_service = get_token_metadata_service()
 
             # Get base token info (e.g., USDC)
-            base_token_address = await self._comet_contract.functions.baseToken().call()
+            base_token_address = await self._call(self._comet_contract.functions.baseToken())
             base_token_meta = await token_service.get_metadata(
                 base_token_address, self._chain, self._web3
             )
-            base_scale = await self._comet_contract.functions.baseScale().call()
+            base_scale = await self._call(self._comet_contract.functions.baseScale())
             base_decimals = int(math.log10(base_scale)) if base_scale > 1 else 6
 
             # Get utilization and rates
-            utilization = await self._comet_contract.functions.getUtilization().call()
-            supply_rate_per_sec = await self._comet_contract.functions.getSupplyRate(utilization).call()
-            borrow_rate_per_sec = await self._comet_contract.functions.getBorrowRate(utilization).call()
+            utilization = await self._call(self._comet_contract.functions.getUtilization())
+            supply_rate_per_sec = await self._call(self._comet_contract.functions.getSupplyRate(utilization))
+            borrow_rate_per_sec = await self._call(self._comet_contract.functions.getBorrowRate(utilization))
 
             # Convert per-second rate to APY
             supply_apy = self._rate_to_apy(supply_rate_per_sec)
             borrow_apy = self._rate_to_apy(borrow_rate_per_sec)
 
             # Get user's base token supply and borrow
-            supply_balance = await self._comet_contract.functions.balanceOf(checksum_address).call()
-            borrow_balance = await self._comet_contract.functions.borrowBalanceOf(checksum_address).call()
+            supply_balance = await self._call(self._comet_contract.functions.balanceOf(checksum_address))
+            borrow_balance = await self._call(self._comet_contract.functions.borrowBalanceOf(checksum_address))
 
             # Get base token price
-            base_price_feed = await self._comet_contract.functions.baseTokenPriceFeed().call()
-            base_price = await self._comet_contract.functions.getPrice(base_price_feed).call()
+            base_price_feed = await self._call(self._comet_contract.functions.baseTokenPriceFeed())
+            base_price = await self._call(self._comet_contract.functions.getPrice(base_price_feed))
             base_price_usd = base_price / 1e8  # Price feeds use 8 decimals
 
             # Build collateral assets list
             collateral_assets: List[CollateralAsset] = []
-            num_assets = await self._comet_contract.functions.numAssets().call()
+            num_assets = await self._call(self._comet_contract.functions.numAssets())
             total_collateral_usd = 0.0
 
             for i in range(num_assets):
-                asset_info = await self._comet_contract.functions.getAssetInfo(i).call()
+                asset_info = await self._call(self._comet_contract.functions.getAssetInfo(i))
                 asset_address = asset_info[1]
                 price_feed = asset_info[2]
                 scale = asset_info[3]  # 10^decimals
@@ -325,9 +536,9 @@ class CompoundV3Adapter(ProtocolAdapter):
                 liquidate_collateral_factor = asset_info[5] / 1e18
 
                 # Get user's collateral balance for this asset
-                collateral_balance = await self._comet_contract.functions.collateralBalanceOf(
+                collateral_balance = await self._call(self._comet_contract.functions.collateralBalanceOf(
                     checksum_address, asset_address
-                ).call()
+                ))
 
                 if collateral_balance > 0:
                     # Get token metadata
@@ -336,7 +547,7 @@ class CompoundV3Adapter(ProtocolAdapter):
                     )
 
                     # Get price
-                    price = await self._comet_contract.functions.getPrice(price_feed).call()
+                    price = await self._call(self._comet_contract.functions.getPrice(price_feed))
                     price_usd = price / 1e8
 
                     # Calculate values
@@ -450,8 +661,8 @@ class CompoundV3Adapter(ProtocolAdapter):
                 chain=self._chain,
                 wallet_address=wallet_address,
                 health_factor=health_factor,
-                collateral_assets=collateral_assets,
-                debt_assets=debt_assets,
+                collateral_assets=tuple(collateral_assets),
+                debt_assets=tuple(debt_assets),
                 total_collateral_usd=total_collateral_usd,
                 total_debt_usd=total_debt_usd,
                 liquidation_threshold=weighted_liq_threshold,
@@ -482,6 +693,6 @@ class CompoundV3Adapter(ProtocolAdapter):
     async def is_liquidatable(self, wallet_address: str) -> bool:
         try:
             checksum_address = AsyncWeb3.to_checksum_address(wallet_address)
-            return await self._comet_contract.functions.isLiquidatable(checksum_address).call()
+            return await self._call(self._comet_contract.functions.isLiquidatable(checksum_address))
         except Exception:
             return False
@@ -194,7 +194,7 @@ def track_rpc_request(endpoint: str, method: str):
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             status = "success"
             try:
                 result = await func(*args, **kwargs)
@@ -204,7 +204,7 @@ def track_rpc_request(endpoint: str, method: str):
                 RPC_ERRORS_TOTAL.labels(endpoint=endpoint, error_type=type(e).__name__).inc()
                 raise
             finally:
-                duration = time.time() - start_time
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
                 RPC_REQUESTS_TOTAL.labels(endpoint=endpoint, method=method, status=status).inc()
                 RPC_REQUEST_DURATION_SECONDS.labels(endpoint=endpoint, method=method).observe(duration)
         return wrapper
@@ -258,14 +258,14 @@ class MonitoringCycleTimer:
     """Context manager for timing monitoring cycles."""
 
     def __init__(self):
-        self._start_time = None
+        self._start_ns = None
 
     def __enter__(self):
-        self._start_time = time.time()
+        self._start_ns = time.perf_counter_ns()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = time.time() - self._start_time
+        duration = (time.perf_counter_ns() - self._start_ns) / 1e9
         MONITORING_CYCLE_DURATION_SECONDS.observe(duration)
 
         status = "success" if exc_type is None else "error"
@@ -7,10 +7,12 @@ This significantly reduces RPC call volume and improves performance.
 
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, List, Tuple
 
 from web3 import AsyncWeb3
 from eth_abi import decode, encode
+from eth_utils import keccak
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +49,12 @@ MULTICALL3_ABI = [
 ]
 
 
+@lru_cache(maxsize=256)
+def _function_selector(function_signature: str) -> bytes:
+    """First 4 bytes of keccak256 of the signature, memoized per signature."""
+    return keccak(text=function_signature)[:4]
+
+
 @dataclass
 class Call:
     """Represents a single contract call to be batched."""
@@ -116,7 +124,7 @@ class MulticallService:
             Call object ready for batching
         """
         # Get function selector (first 4 bytes of keccak256 hash)
-        selector = self._web3.keccak(text=function_signature)[:4]
+        selector = _function_selector(function_signature)
 
         # Encode the input parameters
         if input_types and input_values:
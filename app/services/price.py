@@ -174,7 +174,7 @@ class MultiSourcePriceService:
                     source=PriceSource.UNISWAP_TWAP,
                     is_stale=False,
                     staleness_seconds=None,
-                    timestamp=twap_data.timestamp,
+                    timestamp=twap_data.iso_timestamp.replace(tzinfo=None),  # naive UTC, like the other sources
                     confidence=confidence,
                 )
                 self._cache.set(symbol, unified)
@@ -11,7 +11,7 @@ from collections import deque
 from dataclasses import dataclass
 from typing import List
 
-from web3 import AsyncWeb3, AsyncHTTPProvider
+from web3 import AsyncWeb3, AsyncHTTPProvider, AsyncIPCProvider
 from web3.eth import AsyncEth
 
 from app.config import get_settings
@@ -221,6 +221,38 @@ class FallbackWeb3Provider:
         }
 
 
+class LazyAsyncIPCProvider(AsyncIPCProvider):
+    """AsyncIPCProvider that opens its socket on the first request.
+
+    Persistent providers normally need an explicit ``await provider.connect()``;
+    connecting lazily lets adapters build their Web3 instance synchronously.
+    """
+
+    # Hooks into AsyncIPCProvider internals (socket_send and the _writer stream),
+    # which are private API: verified against web3 7.14, recheck on upgrades.
+    _connect_lock: asyncio.Lock | None = None
+
+    async def socket_send(self, request_data: bytes) -> None:
+        if self._writer is None:
+            if self._connect_lock is None:
+                self._connect_lock = asyncio.Lock()
+            async with self._connect_lock:
+                if self._writer is None:
+                    await self.connect()
+        return await super().socket_send(request_data)
+
+
+def create_chain_web3(chain: str) -> AsyncWeb3:
+    """Build an AsyncWeb3 for a chain, preferring a local node IPC socket over HTTP."""
+    settings = get_settings()
+    ipc_path = settings.get_ipc_path(chain)
+    if ipc_path:
+        provider = LazyAsyncIPCProvider(ipc_path)
+    else:
+        provider = AsyncHTTPProvider(settings.get_rpc_url(chain))
+    return AsyncWeb3(provider, modules={"eth": (AsyncEth,)})
+
+
 # Singleton instances
 _web3_provider: FallbackWeb3Provider | None = None
 _web3_instance: AsyncWeb3 | None = None
@@ -6,45 +6,322 @@ with caching to minimize RPC calls.
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
-from typing import Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping
 
+from eth_abi import decode
+from eth_hash.auto import keccak
 from web3 import AsyncWeb3
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TokenMetadata:
-    """ERC20 token metadata."""
+    """ERC20 token metadata (immutable; instances are shared through the caches)."""
     address: str
     symbol: str
     decimals: int
     name: str | None = None
 
 
-# ERC20 ABI for metadata calls
-ERC20_METADATA_ABI = [
-    {
-        "inputs": [],
-        "name": "symbol",
-        "outputs": [{"internalType": "string", "name": "", "type": "string"}],
-        "stateMutability": "view",
-        "type": "function",
-    },
-    {
-        "inputs": [],
-        "name": "decimals",
-        "outputs": [{"internalType": "uint8", "name": "", "type": "uint8"}],
-        "stateMutability": "view",
-        "type": "function",
-    },
-    {
-        "inputs": [],
-        "name": "name",
-        "outputs": [{"internalType": "string", "name": "", "type": "string"}],
-        "stateMutability": "view",
-        "type": "function",
-    },
-]
+@lru_cache(maxsize=4096)
+def _to_checksum(address: str | bytes) -> str:
+    """EIP-55 checksum an address with a single keccak, memoized per input.
+
+    Accepts a hex string (with or without 0x) or raw 20-byte address, like
+    eth_utils.to_checksum_address.
+    """
+    if isinstance(address, bytes):
+        hex_address = address.hex() if len(address) == 20 else ""
+    else:
+        hex_address = address.lower().removeprefix("0x")
+    if len(hex_address) != 40 or hex_address.strip("0123456789abcdef"):
+        raise ValueError(f"Invalid address: {address!r}")
+    digest = keccak(hex_address.encode("ascii")).hex()
+    return "0x" + "".join(
+        char.upper() if digest[i] in "89abcdef" else char
+        for i, char in enumerate(hex_address)
+    )
+
+
+def _bulk_checksum(addresses: Iterable[str | bytes]) -> List[str]:
+    """Checksum many addresses, reusing memoized results for repeats."""
+    return [_to_checksum(address) for address in addresses]
+
+
+# ERC20 metadata getter selectors (first 4 bytes of keccak256 of the signature).
+# Calls are sent as raw eth_call and decoded with eth_abi, bypassing Contract objects.
+_ERC20_SYMBOL_CALLDATA = bytes.fromhex("95d89b41")  # symbol()
+_ERC20_DECIMALS_CALLDATA = bytes.fromhex("313ce567")  # decimals()
+_ERC20_NAME_CALLDATA = bytes.fromhex("06fdde03")  # name()
+
+
+# Hardcoded metadata for common tokens (avoid RPC calls)
+# Format: chain -> address -> TokenMetadata (read-only)
+_KNOWN_TOKENS: Mapping[str, Mapping[str, TokenMetadata]] = MappingProxyType({
+    "ethereum": MappingProxyType({
+        # Stablecoins
+        "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48": TokenMetadata(
+            address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+            symbol="USDC",
+            decimals=6,
+            name="USD Coin",
+        ),
+        "0xdAC17F958D2ee523a2206206994597C13D831ec7": TokenMetadata(
+            address="0xdAC17F958D2ee523a2206206994597C13D831ec7",
+            symbol="USDT",
+            decimals=6,
+            name="Tether USD",
+        ),
+        "0x6B175474E89094C44Da98b954EedeAC495271d0F": TokenMetadata(
+            address="0x6B175474E89094C44Da98b954EedeAC495271d0F",
+            symbol="DAI",
+            decimals=18,
+            name="Dai Stablecoin",
+        ),
+        "0x853d955aCEf822Db058eb8505911ED77F175b99e": TokenMetadata(
+            address="0x853d955aCEf822Db058eb8505911ED77F175b99e",
+            symbol="FRAX",
+            decimals=18,
+            name="Frax",
+        ),
+        "0x5f98805A4E8be255a32880FDeC7F6728C6568bA0": TokenMetadata(
+            address="0x5f98805A4E8be255a32880FDeC7F6728C6568bA0",
+            symbol="LUSD",
+            decimals=18,
+            name="Liquity USD",
+        ),
+        # Major assets
+        "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2": TokenMetadata(
+            address="0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
+            symbol="WETH",
+            decimals=18,
+            name="Wrapped Ether",
+        ),
+        "0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599": TokenMetadata(
+            address="0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599",
+            symbol="WBTC",
+            decimals=8,
+            name="Wrapped BTC",
+        ),
+        # Liquid Staking Derivatives (LSDs)
+        "0xae7ab96520DE3A18E5e111B5EaAb095312D7fE84": TokenMetadata(
+            address="0xae7ab96520DE3A18E5e111B5EaAb095312D7fE84",
+            symbol="stETH",
+            decimals=18,
+            name="Lido Staked Ether",
+        ),
+        "0x7f39C581F595B53c5cb19bD0b3f8dA6c935E2Ca0": TokenMetadata(
+            address="0x7f39C581F595B53c5cb19bD0b3f8dA6c935E2Ca0",
+            symbol="wstETH",
+            decimals=18,
+            name="Wrapped stETH",
+        ),
+        "0xae78736Cd615f374D3085123A210448E74Fc6393": TokenMetadata(
+            address="0xae78736Cd615f374D3085123A210448E74Fc6393",
+            symbol="rETH",
+            decimals=18,
+            name="Rocket Pool ETH",
+        ),
+        "0xBe9895146f7AF43049ca1c1AE358B0541Ea49704": TokenMetadata(
+            address="0xBe9895146f7AF43049ca1c1AE358B0541Ea49704",
+            symbol="cbETH",
+            decimals=18,
+            name="Coinbase Wrapped Staked ETH",
+        ),
+        # DeFi tokens
+        "0x514910771AF9Ca656af840dff83E8264EcF986CA": TokenMetadata(
+            address="0x514910771AF9Ca656af840dff83E8264EcF986CA",
+            symbol="LINK",
+            decimals=18,
+            name="Chainlink",
+        ),
+        "0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984": TokenMetadata(
+            address="0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984",
+            symbol="UNI",
+            decimals=18,
+            name="Uniswap",
+        ),
+        "0x7Fc66500c84A76Ad7e9c93437bFc5Ac33E2DDaE9": TokenMetadata(
+            address="0x7Fc66500c84A76Ad7e9c93437bFc5Ac33E2DDaE9",
+            symbol="AAVE",
+            decimals=18,
+            name="Aave",
+        ),
+        "0xD533a949740bb3306d119CC777fa900bA034cd52": TokenMetadata(
+            address="0xD533a949740bb3306d119CC777fa900bA034cd52",
+            symbol="CRV",
+            decimals=18,
+            name="Curve DAO Token",
+        ),
+        "0x9f8F72aA9304c8B593d555F12eF6589cC3A579A2": TokenMetadata(
+            address="0x9f8F72aA9304c8B593d555F12eF6589cC3A579A2",
+            symbol="MKR",
+            decimals=18,
+            name="Maker",
+        ),
+        "0xc00e94Cb662C3520282E6f5717214004A7f26888": TokenMetadata(
+            address="0xc00e94Cb662C3520282E6f5717214004A7f26888",
+            symbol="COMP",
+            decimals=18,
+            name="Compound",
+        ),
+    }),
+    "arbitrum": MappingProxyType({
+        # USDC (native)
+        "0xaf88d065e77c8cC2239327C5EDb3A432268e5831": TokenMetadata(
+            address="0xaf88d065e77c8cC2239327C5EDb3A432268e5831",
+            symbol="USDC",
+            decimals=6,
+            name="USD Coin",
+        ),
+        # USDC.e (bridged)
+        "0xFF970A61A04b1cA14834A43f5dE4533eBDDB5CC8": TokenMetadata(
+            address="0xFF970A61A04b1cA14834A43f5dE4533eBDDB5CC8",
+            symbol="USDC.e",
+            decimals=6,
+            name="Bridged USDC",
+        ),
+        "0xFd086bC7CD5C481DCC9C85ebE478A1C0b69FCbb9": TokenMetadata(
+            address="0xFd086bC7CD5C481DCC9C85ebE478A1C0b69FCbb9",
+            symbol="USDT",
+            decimals=6,
+            name="Tether USD",
+        ),
+        "0xDA10009cBd5D07dd0CeCc66161FC93D7c9000da1": TokenMetadata(
+            address="0xDA10009cBd5D07dd0CeCc66161FC93D7c9000da1",
+            symbol="DAI",
+            decimals=18,
+            name="Dai Stablecoin",
+        ),
+        "0x82aF49447D8a07e3bd95BD0d56f35241523fBab1": TokenMetadata(
+            address="0x82aF49447D8a07e3bd95BD0d56f35241523fBab1",
+            symbol="WETH",
+            decimals=18,
+            name="Wrapped Ether",
+        ),
+        "0x2f2a2543B76A4166549F7aaB2e75Bef0aefC5B0f": TokenMetadata(
+            address="0x2f2a2543B76A4166549F7aaB2e75Bef0aefC5B0f",
+            symbol="WBTC",
+            decimals=8,
+            name="Wrapped BTC",
+        ),
+        "0x5979D7b546E38E414F7E9822514be443A4800529": TokenMetadata(
+            address="0x5979D7b546E38E414F7E9822514be443A4800529",
+            symbol="wstETH",
+            decimals=18,
+            name="Wrapped stETH",
+        ),
+        "0xEC70Dcb4A1EFa46b8F2D97C310C9c4790ba5ffA8": TokenMetadata(
+            address="0xEC70Dcb4A1EFa46b8F2D97C310C9c4790ba5ffA8",
+            symbol="rETH",
+            decimals=18,
+            name="Rocket Pool ETH",
+        ),
+        "0xf97f4df75117a78c1A5a0DBb814Af92458539FB4": TokenMetadata(
+            address="0xf97f4df75117a78c1A5a0DBb814Af92458539FB4",
+            symbol="LINK",
+            decimals=18,
+            name="Chainlink",
+        ),
+        "0x912CE59144191C1204E64559FE8253a0e49E6548": TokenMetadata(
+            address="0x912CE59144191C1204E64559FE8253a0e49E6548",
+            symbol="ARB",
+            decimals=18,
+            name="Arbitrum",
+        ),
+    }),
+    "base": MappingProxyType({
+        "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913": TokenMetadata(
+            address="0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
+            symbol="USDC",
+            decimals=6,
+            name="USD Coin",
+        ),
+        "0x4200000000000000000000000000000000000006": TokenMetadata(
+            address="0x4200000000000000000000000000000000000006",
+            symbol="WETH",
+            decimals=18,
+            name="Wrapped Ether",
+        ),
+        "0x50c5725949A6F0c72E6C4a641F24049A917DB0Cb": TokenMetadata(
+            address="0x50c5725949A6F0c72E6C4a641F24049A917DB0Cb",
+            symbol="DAI",
+            decimals=18,
+            name="Dai Stablecoin",
+        ),
+        "0xc1CBa3fCea344f92D9239c08C0568f6F2F0ee452": TokenMetadata(
+            address="0xc1CBa3fCea344f92D9239c08C0568f6F2F0ee452",
+            symbol="wstETH",
+            decimals=18,
+            name="Wrapped stETH",
+        ),
+        "0x2Ae3F1Ec7F1F5012CFEab0185bfc7aa3cf0DEc22": TokenMetadata(
+            address="0x2Ae3F1Ec7F1F5012CFEab0185bfc7aa3cf0DEc22",
+            symbol="cbETH",
+            decimals=18,
+            name="Coinbase Wrapped Staked ETH",
+        ),
+    }),
+    "optimism": MappingProxyType({
+        "0x0b2C639c533813f4Aa9D7837CAf62653d097Ff85": TokenMetadata(
+            address="0x0b2C639c533813f4Aa9D7837CAf62653d097Ff85",
+            symbol="USDC",
+            decimals=6,
+            name="USD Coin",
+        ),
+        "0x7F5c764cBc14f9669B88837ca1490cCa17c31607": TokenMetadata(
+            address="0x7F5c764cBc14f9669B88837ca1490cCa17c31607",
+            symbol="USDC.e",
+            decimals=6,
+            name="Bridged USDC",
+        ),
+        "0x94b008aA00579c1307B0EF2c499aD98a8ce58e58": TokenMetadata(
+            address="0x94b008aA00579c1307B0EF2c499aD98a8ce58e58",
+            symbol="USDT",
+            decimals=6,
+            name="Tether USD",
+        ),
+        "0xDA10009cBd5D07dd0CeCc66161FC93D7c9000da1": TokenMetadata(
+            address="0xDA10009cBd5D07dd0CeCc66161FC93D7c9000da1",
+            symbol="DAI",
+            decimals=18,
+            name="Dai Stablecoin",
+        ),
+        "0x4200000000000000000000000000000000000006": TokenMetadata(
+            address="0x4200000000000000000000000000000000000006",
+            symbol="WETH",
+            decimals=18,
+            name="Wrapped Ether",
+        ),
+        "0x68f180fcCe6836688e9084f035309E29Bf0A2095": TokenMetadata(
+            address="0x68f180fcCe6836688e9084f035309E29Bf0A2095",
+            symbol="WBTC",
+            decimals=8,
+            name="Wrapped BTC",
+        ),
+        "0x1F32b1c2345538c0c6f582fCB022739c4A194Ebb": TokenMetadata(
+            address="0x1F32b1c2345538c0c6f582fCB022739c4A194Ebb",
+            symbol="wstETH",
+            decimals=18,
+            name="Wrapped stETH",
+        ),
+        "0x9Bcef72be871e61ED4fBbc7630889beE758eb81D": TokenMetadata(
+            address="0x9Bcef72be871e61ED4fBbc7630889beE758eb81D",
+            symbol="rETH",
+            decimals=18,
+            name="Rocket Pool ETH",
+        ),
+        "0x4200000000000000000000000000000000000042": TokenMetadata(
+            address="0x4200000000000000000000000000000000000042",
+            symbol="OP",
+            decimals=18,
+            name="Optimism",
+        ),
+    }),
+})
 
 
 class TokenMetadataService:
@@ -54,282 +331,34 @@ class TokenMetadataService:
     Common tokens are hardcoded to avoid RPC calls.
     """
 
-    # Hardcoded metadata for common tokens (avoid RPC calls)
-    # Format: chain -> address -> TokenMetadata
-    KNOWN_TOKENS: Dict[str, Dict[str, TokenMetadata]] = {
-        "ethereum": {
-            # Stablecoins
-            "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48": TokenMetadata(
-                address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
-                symbol="USDC",
-                decimals=6,
-                name="USD Coin",
-            ),
-            "0xdAC17F958D2ee523a2206206994597C13D831ec7": TokenMetadata(
-                address="0xdAC17F958D2ee523a2206206994597C13D831ec7",
-                symbol="USDT",
-                decimals=6,
-                name="Tether USD",
-            ),
-            "0x6B175474E89094C44Da98b954EedeAC495271d0F": TokenMetadata(
-                address="0x6B175474E89094C44Da98b954EedeAC495271d0F",
-                symbol="DAI",
-                decimals=18,
-                name="Dai Stablecoin",
-            ),
-            "0x853d955aCEf822Db058eb8505911ED77F175b99e": TokenMetadata(
-                address="0x853d955aCEf822Db058eb8505911ED77F175b99e",
-                symbol="FRAX",
-                decimals=18,
-                name="Frax",
-            ),
-            "0x5f98805A4E8be255a32880FDeC7F6728C6568bA0": TokenMetadata(
-                address="0x5f98805A4E8be255a32880FDeC7F6728C6568bA0",
-                symbol="LUSD",
-                decimals=18,
-                name="Liquity USD",
-            ),
-            # Major assets
-            "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2": TokenMetadata(
-                address="0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
-                symbol="WETH",
-                decimals=18,
-                name="Wrapped Ether",
-            ),
-            "0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599": TokenMetadata(
-                address="0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599",
-                symbol="WBTC",
-                decimals=8,
-                name="Wrapped BTC",
-            ),
-            # Liquid Staking Derivatives (LSDs)
-            "0xae7ab96520DE3A18E5e111B5EaAb095312D7fE84": TokenMetadata(
-                address="0xae7ab96520DE3A18E5e111B5EaAb095312D7fE84",
-                symbol="stETH",
-                decimals=18,
-                name="Lido Staked Ether",
-            ),
-            "0x7f39C581F595B53c5cb19bD0b3f8dA6c935E2Ca0": TokenMetadata(
-                address="0x7f39C581F595B53c5cb19bD0b3f8dA6c935E2Ca0",
-                symbol="wstETH",
-                decimals=18,
-                name="Wrapped stETH",
-            ),
-            "0xae78736Cd615f374D3085123A210448E74Fc6393": TokenMetadata(
-                address="0xae78736Cd615f374D3085123A210448E74Fc6393",
-                symbol="rETH",
-                decimals=18,
-                name="Rocket Pool ETH",
-            ),
-            "0xBe9895146f7AF43049ca1c1AE358B0541Ea49704": TokenMetadata(
-                address="0xBe9895146f7AF43049ca1c1AE358B0541Ea49704",
-                symbol="cbETH",
-                decimals=18,
-                name="Coinbase Wrapped Staked ETH",
-            ),
-            # DeFi tokens
-            "0x514910771AF9Ca656af840dff83E8264EcF986CA": TokenMetadata(
-                address="0x514910771AF9Ca656af840dff83E8264EcF986CA",
-                symbol="LINK",
-                decimals=18,
-                name="Chainlink",
-            ),
-            "0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984": TokenMetadata(
-                address="0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984",
-                symbol="UNI",
-                decimals=18,
-                name="Uniswap",
-            ),
-            "0x7Fc66500c84A76Ad7e9c93437bFc5Ac33E2DDaE9": TokenMetadata(
-                address="0x7Fc66500c84A76Ad7e9c93437bFc5Ac33E2DDaE9",
-                symbol="AAVE",
-                decimals=18,
-                name="Aave",
-            ),
-            "0xD533a949740bb3306d119CC777fa900bA034cd52": TokenMetadata(
-                address="0xD533a949740bb3306d119CC777fa900bA034cd52",
-                symbol="CRV",
-                decimals=18,
-                name="Curve DAO Token",
-            ),
-            "0x9f8F72aA9304c8B593d555F12eF6589cC3A579A2": TokenMetadata(
-                address="0x9f8F72aA9304c8B593d555F12eF6589cC3A579A2",
-                symbol="MKR",
-                decimals=18,
-                name="Maker",
-            ),
-            "0xc00e94Cb662C3520282E6f5717214004A7f26888": TokenMetadata(
-                address="0xc00e94Cb662C3520282E6f5717214004A7f26888",
-                symbol="COMP",
-                decimals=18,
-                name="Compound",
-            ),
-        },
-        "arbitrum": {
-            # USDC (native)
-            "0xaf88d065e77c8cC2239327C5EDb3A432268e5831": TokenMetadata(
-                address="0xaf88d065e77c8cC2239327C5EDb3A432268e5831",
-                symbol="USDC",
-                decimals=6,
-                name="USD Coin",
-            ),
-            # USDC.e (bridged)
-            "0xFF970A61A04b1cA14834A43f5dE4533eBDDB5CC8": TokenMetadata(
-                address="0xFF970A61A04b1cA14834A43f5dE4533eBDDB5CC8",
-                symbol="USDC.e",
-                decimals=6,
-                name="Bridged USDC",
-            ),
-            "0xFd086bC7CD5C481DCC9C85ebE478A1C0b69FCbb9": TokenMetadata(
-                address="0xFd086bC7CD5C481DCC9C85ebE478A1C0b69FCbb9",
-                symbol="USDT",
-                decimals=6,
-                name="Tether USD",
-            ),
-            "0xDA10009cBd5D07dd0CeCc66161FC93D7c9000da1": TokenMetadata(
-                address="0xDA10009cBd5D07dd0CeCc66161FC93D7c9000da1",
-                symbol="DAI",
-                decimals=18,
-                name="Dai Stablecoin",
-            ),
-            "0x82aF49447D8a07e3bd95BD0d56f35241523fBab1": TokenMetadata(
-                address="0x82aF49447D8a07e3bd95BD0d56f35241523fBab1",
-                symbol="WETH",
-                decimals=18,
-                name="Wrapped Ether",
-            ),
-            "0x2f2a2543B76A4166549F7aaB2e75Bef0aefC5B0f": TokenMetadata(
-                address="0x2f2a2543B76A4166549F7aaB2e75Bef0aefC5B0f",
-                symbol="WBTC",
-                decimals=8,
-                name="Wrapped BTC",
-            ),
-            "0x5979D7b546E38E414F7E9822514be443A4800529": TokenMetadata(
-                address="0x5979D7b546E38E414F7E9822514be443A4800529",
-                symbol="wstETH",
-                decimals=18,
-                name="Wrapped stETH",
-            ),
-            "0xEC70Dcb4A1EFa46b8F2D97C310C9c4790ba5ffA8": TokenMetadata(
-                address="0xEC70Dcb4A1EFa46b8F2D97C310C9c4790ba5ffA8",
-                symbol="rETH",
-                decimals=18,
-                name="Rocket Pool ETH",
-            ),
-            "0xf97f4df75117a78c1A5a0DBb814Af92458539FB4": TokenMetadata(
-                address="0xf97f4df75117a78c1A5a0DBb814Af92458539FB4",
-                symbol="LINK",
-                decimals=18,
-                name="Chainlink",
-            ),
-            "0x912CE59144191C1204E64559FE8253a0e49E6548": TokenMetadata(
-                address="0x912CE59144191C1204E64559FE8253a0e49E6548",
-                symbol="ARB",
-                decimals=18,
-                name="Arbitrum",
-            ),
-        },
-        "base": {
-            "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913": TokenMetadata(
-                address="0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
-                symbol="USDC",
-                decimals=6,
-                name="USD Coin",
-            ),
-            "0x4200000000000000000000000000000000000006": TokenMetadata(
-                address="0x4200000000000000000000000000000000000006",
-                symbol="WETH",
-                decimals=18,
-                name="Wrapped Ether",
-            ),
-            "0x50c5725949A6F0c72E6C4a641F24049A917DB0Cb": TokenMetadata(
-                address="0x50c5725949A6F0c72E6C4a641F24049A917DB0Cb",
-                symbol="DAI",
-                decimals=18,
-                name="Dai Stablecoin",
-            ),
-            "0xc1CBa3fCea344f92D9239c08C0568f6F2F0ee452": TokenMetadata(
-                address="0xc1CBa3fCea344f92D9239c08C0568f6F2F0ee452",
-                symbol="wstETH",
-                decimals=18,
-                name="Wrapped stETH",
-            ),
-            "0x2Ae3F1Ec7F1F5012CFEab0185bfc7aa3cf0DEc22": TokenMetadata(
-                address="0x2Ae3F1Ec7F1F5012CFEab0185bfc7aa3cf0DEc22",
-                symbol="cbETH",
-                decimals=18,
-                name="Coinbase Wrapped Staked ETH",
-            ),
-        },
-        "optimism": {
-            "0x0b2C639c533813f4Aa9D7837CAf62653d097Ff85": TokenMetadata(
-                address="0x0b2C639c533813f4Aa9D7837CAf62653d097Ff85",
-                symbol="USDC",
-                decimals=6,
-                name="USD Coin",
-            ),
-            "0x7F5c764cBc14f9669B88837ca1490cCa17c31607": TokenMetadata(
-                address="0x7F5c764cBc14f9669B88837ca1490cCa17c31607",
-                symbol="USDC.e",
-                decimals=6,
-                name="Bridged USDC",
-            ),
-            "0x94b008aA00579c1307B0EF2c499aD98a8ce58e58": TokenMetadata(
-                address="0x94b008aA00579c1307B0EF2c499aD98a8ce58e58",
-                symbol="USDT",
-                decimals=6,
-                name="Tether USD",
-            ),
-            "0xDA10009cBd5D07dd0CeCc66161FC93D7c9000da1": TokenMetadata(
-                address="0xDA10009cBd5D07dd0CeCc66161FC93D7c9000da1",
-                symbol="DAI",
-                decimals=18,
-                name="Dai Stablecoin",
-            ),
-            "0x4200000000000000000000000000000000000006": TokenMetadata(
-                address="0x4200000000000000000000000000000000000006",
-                symbol="WETH",
-                decimals=18,
-                name="Wrapped Ether",
-            ),
-            "0x68f180fcCe6836688e9084f035309E29Bf0A2095": TokenMetadata(
-                address="0x68f180fcCe6836688e9084f035309E29Bf0A2095",
-                symbol="WBTC",
-                decimals=8,
-                name="Wrapped BTC",
-            ),
-            "0x1F32b1c2345538c0c6f582fCB022739c4A194Ebb": TokenMetadata(
-                address="0x1F32b1c2345538c0c6f582fCB022739c4A194Ebb",
-                symbol="wstETH",
-                decimals=18,
-                name="Wrapped stETH",
-            ),
-            "0x9Bcef72be871e61ED4fBbc7630889beE758eb81D": TokenMetadata(
-                address="0x9Bcef72be871e61ED4fBbc7630889beE758eb81D",
-                symbol="rETH",
-                decimals=18,
-                name="Rocket Pool ETH",
-            ),
-            "0x4200000000000000000000000000000000000042": TokenMetadata(
-                address="0x4200000000000000000000000000000000000042",
-                symbol="OP",
-                decimals=18,
-                name="Optimism",
-            ),
-        },
-    }
+    # Backward-compatible alias; internal lookups use the module-level table
+    KNOWN_TOKENS = _KNOWN_TOKENS
+
+    # Failed RPC lookups are remembered so dead/spam addresses aren't re-queried
+    NEGATIVE_CACHE_TTL_SECONDS = 300.0
+    NEGATIVE_CACHE_MAX_ENTRIES = 10_000
 
     def __init__(self, web3_provider: AsyncWeb3 | None = None):
         self._cache: Dict[str, TokenMetadata] = {}
+        self._neg_cache: Dict[str, float] = {}  # cache_key -> expiry (monotonic)
         self._web3 = web3_provider
 
     def _cache_key(self, address: str, chain: str) -> str:
         """Generate cache key for address:chain."""
         return f"{chain}:{address.lower()}"
 
-    def _normalize_address(self, address: str) -> str:
+    def _normalize_address(self, address: str | bytes) -> str:
         """Normalize address to checksum format."""
-        return AsyncWeb3.to_checksum_address(address)
+        return _to_checksum(address)
+
+    def _record_miss(self, cache_key: str) -> None:
+        """Remember a failed RPC lookup, purging expired entries when the cache is large."""
+        now = time.monotonic()
+        if len(self._neg_cache) > self.NEGATIVE_CACHE_MAX_ENTRIES:
+            self._neg_cache = {
+                key: expiry for key, expiry in self._neg_cache.items() if expiry > now
+            }
+        self._neg_cache[cache_key] = now + self.NEGATIVE_CACHE_TTL_SECONDS
 
     async def get_metadata(
         self,
@@ -354,8 +383,15 @@ class TokenMetadataService:
         if cache_key in self._cache:
             return self._cache[cache_key]
 
+        # Skip addresses whose RPC lookup recently failed
+        expiry = self._neg_cache.get(cache_key)
+        if expiry is not None:
+            if time.monotonic() < expiry:
+                return None
+            del self._neg_cache[cache_key]
+
         # Check hardcoded tokens
-        chain_tokens = self.KNOWN_TOKENS.get(chain, {})
+        chain_tokens = _KNOWN_TOKENS.get(chain, {})
         if checksum_address in chain_tokens:
             metadata = chain_tokens[checksum_address]
             self._cache[cache_key] = metadata
@@ -371,6 +407,7 @@ class TokenMetadataService:
                     return metadata
             except Exception:
                 pass  # Silently fail, return None
+            self._record_miss(cache_key)
 
         return None
 
@@ -381,18 +418,16 @@ class TokenMetadataService:
     ) -> TokenMetadata | None:
         """Fetch token metadata from RPC."""
         try:
-            contract = web3.eth.contract(
-                address=address,
-                abi=ERC20_METADATA_ABI,
-            )
-
             # Fetch symbol and decimals (name is optional)
-            symbol = await contract.functions.symbol().call()
-            decimals = await contract.functions.decimals().call()
+            raw = await web3.eth.call({"to": address, "data": _ERC20_SYMBOL_CALLDATA})
+            symbol = decode(["string"], raw)[0]
+            raw = await web3.eth.call({"to": address, "data": _ERC20_DECIMALS_CALLDATA})
+            decimals = decode(["uint8"], raw)[0]
 
             name = None
             try:
-                name = await contract.functions.name().call()
+                raw = await web3.eth.call({"to": address, "data": _ERC20_NAME_CALLDATA})
+                name = decode(["string"], raw)[0]
             except Exception:
                 pass  # Name is optional
 
@@ -422,10 +457,10 @@ class TokenMetadataService:
             Dict mapping address -> TokenMetadata
         """
         result = {}
-        for address in addresses:
-            metadata = await self.get_metadata(address, chain, web3)
+        for checksum_address in _bulk_checksum(addresses):
+            metadata = await self.get_metadata(checksum_address, chain, web3)
             if metadata:
-                result[self._normalize_address(address)] = metadata
+                result[checksum_address] = metadata
         return result
 
     def get_known_token(self, address: str, chain: str = "ethereum") -> TokenMetadata | None:
@@ -439,17 +474,14 @@ class TokenMetadataService:
             TokenMetadata or None if not in hardcoded list
         """
         checksum_address = self._normalize_address(address)
-        chain_tokens = self.KNOWN_TOKENS.get(chain, {})
+        chain_tokens = _KNOWN_TOKENS.get(chain, {})
         return chain_tokens.get(checksum_address)
 
 
-# Singleton instance
-_token_metadata_service: TokenMetadataService | None = None
+# Singleton instance (created at import; construction makes no network calls)
+_token_metadata_service = TokenMetadataService()
 
 
 def get_token_metadata_service() -> TokenMetadataService:
     """Get the singleton TokenMetadataService instance."""
-    global _token_metadata_service
-    if _token_metadata_service is None:
-        _token_metadata_service = TokenMetadataService()
     return _token_metadata_service
@@ -4,9 +4,16 @@ This module provides time-weighted average price (TWAP) calculations
 from Uniswap V3 pools, used as a fallback when Chainlink is unavailable.
 """
 
+import asyncio
 import logging
-from dataclasses import dataclass
-from datetime import datetime
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import List
+
 from web3 import AsyncWeb3
 
 from app.services.rpc import get_web3
@@ -32,6 +39,12 @@ UNISWAP_V3_POOLS = {
     "LDO-WETH": ("0xa3f558aEbAecAf0e11cA4b2199cC5Ed341edfd74", "WETH", 3000, True),
 }
 
+# ln(1.0001): tick -> price is exp(tick * ln(1.0001)), cheaper than a float pow
+_LN_1_0001 = math.log(1.0001)
+
+# 10 ** (token0_decimals - token1_decimals) for every realistic decimals delta
+_DECIMAL_SCALE = {delta: 10.0**delta for delta in range(-24, 25)}
+
 UNISWAP_V3_POOL_ABI = [
     {
         "inputs": [],
@@ -82,6 +95,17 @@ UNISWAP_V3_POOL_ABI = [
 ]
 
 
+@lru_cache(maxsize=1024)
+def _resolve_pool(symbol: str) -> tuple | None:
+    """Find the Uniswap V3 pool for a symbol, preferring the WETH pair over USDC."""
+    return UNISWAP_V3_POOLS.get(f"{symbol}-WETH") or UNISWAP_V3_POOLS.get(f"{symbol}-USDC")
+
+
+@lru_cache(maxsize=1024)
+def _is_supported(symbol: str) -> bool:
+    return _resolve_pool(symbol) is not None or symbol == "WETH"
+
+
 @dataclass
 class TWAPPrice:
     symbol: str
@@ -91,9 +115,14 @@ class TWAPPrice:
     deviation_percent: float
     pool_address: str
     liquidity: int
-    timestamp: datetime
+    timestamp: int  # Unix time in nanoseconds (time.time_ns())
     source: str = "uniswap_v3_twap"
 
+    @property
+    def iso_timestamp(self) -> datetime:
+        """Timestamp as a timezone-aware UTC datetime."""
+        return datetime.fromtimestamp(self.timestamp / 1e9, tz=timezone.utc)
+
 
 class UniswapV3Oracle:
     """Uniswap V3 TWAP Oracle as fallback for Chainlink."""
@@ -101,13 +130,27 @@ class UniswapV3Oracle:
     Q96 = 2**96
     DEFAULT_TWAP_SECONDS = 1800  # 30 minutes
 
+    # TWAP results are reused within a block: (symbol, block, twap_seconds) -> TWAPPrice
+    TWAP_CACHE_SIZE = 1000
+    BLOCK_NUMBER_TTL_SECONDS = 1.0
+
     def __init__(self, web3: AsyncWeb3 | None = None):
-        self._web3 = web3 or get_web3()
+        self._web3_instance = web3
         self._eth_price_usd: float | None = None
+        self._twap_cache: OrderedDict[tuple[str, int, int], TWAPPrice] = OrderedDict()
+        self._block_number: int | None = None
+        self._block_number_fetched_at = 0.0
+
+    @property
+    def _web3(self) -> AsyncWeb3:
+        # Resolved lazily so the module-level singleton doesn't need settings at import
+        if self._web3_instance is None:
+            self._web3_instance = get_web3()
+        return self._web3_instance
 
     def _tick_to_price(self, tick: int, token0_decimals: int = 18, token1_decimals: int = 18) -> float:
         """Convert Uniswap V3 tick to price."""
-        return (1.0001**tick) * (10 ** (token0_decimals - token1_decimals))
+        return math.exp(tick * _LN_1_0001) * _DECIMAL_SCALE[token0_decimals - token1_decimals]
 
     def _sqrt_price_x96_to_price(
         self,
@@ -116,98 +159,205 @@ class UniswapV3Oracle:
         token1_decimals: int = 18,
     ) -> float:
         """Convert sqrtPriceX96 to actual price."""
-        price = (sqrt_price_x96 / self.Q96) ** 2
-        return price * (10 ** (token0_decimals - token1_decimals))
+        sqrt_price = sqrt_price_x96 / self.Q96
+        return sqrt_price * sqrt_price * _DECIMAL_SCALE[token0_decimals - token1_decimals]
+
+    async def _get_block_number(self) -> int:
+        """Get the latest block number, reusing it for BLOCK_NUMBER_TTL_SECONDS."""
+        now = time.monotonic()
+        if (
+            self._block_number is None
+            or now - self._block_number_fetched_at > self.BLOCK_NUMBER_TTL_SECONDS
+        ):
+            self._block_number = await self._web3.eth.block_number
+            self._block_number_fetched_at = now
+        return self._block_number
 
     async def set_eth_price_usd(self, price: float):
         """Set ETH/USD price for converting WETH-denominated prices."""
         self._eth_price_usd = price
 
+    def _get_pool_contract(self, pool_address: str):
+        return self._web3.eth.contract(
+            address=AsyncWeb3.to_checksum_address(pool_address),
+            abi=UNISWAP_V3_POOL_ABI,
+        )
+
+    def _get_cached_twap(self, cache_key: tuple[str, int, int]) -> TWAPPrice | None:
+        cached = self._twap_cache.get(cache_key)
+        if cached is None:
+            return None
+        self._twap_cache.move_to_end(cache_key)
+        return replace(cached, timestamp=time.time_ns())
+
+    def _cache_twap(self, cache_key: tuple[str, int, int], twap: TWAPPrice) -> TWAPPrice:
+        self._twap_cache[cache_key] = twap
+        if len(self._twap_cache) > self.TWAP_CACHE_SIZE:
+            self._twap_cache.popitem(last=False)
+        return twap
+
+    def _build_twap(
+        self,
+        symbol: str,
+        pool_data: tuple,
+        twap_seconds: int,
+        slot0: tuple,
+        observations: tuple,
+        liquidity: int,
+    ) -> TWAPPrice:
+        """Build a TWAPPrice from raw slot0/observe/liquidity pool reads."""
+        pool_address, quote_token, fee_tier, token0_is_base = pool_data
+
+        current_tick = slot0[1]
+        tick_cumulatives = observations[0]
+
+        # Calculate TWAP tick
+        twap_tick = (tick_cumulatives[1] - tick_cumulatives[0]) // twap_seconds
+
+        # Determine decimals based on tokens
+        if quote_token == "USDC" or quote_token == "USDT":
+            quote_decimals = 6
+        else:
+            quote_decimals = 18
+
+        base_decimals = 18  # Most tokens are 18 decimals
+        if symbol == "WBTC":
+            base_decimals = 8
+        elif symbol in ["USDC", "USDT"]:
+            base_decimals = 6
+
+        # Calculate spot price; TWAP differs from it by 1.0001**tick_delta
+        spot_price = self._tick_to_price(current_tick, base_decimals, quote_decimals)
+        tick_delta = current_tick - twap_tick
+
+        # Invert if needed (token0 is quote)
+        if not token0_is_base:
+            spot_price = 1 / spot_price
+            tick_delta = -tick_delta
+
+        # ln(spot / twap), shared by the TWAP price and the deviation
+        log_ratio = tick_delta * _LN_1_0001
+        twap_price = spot_price * math.exp(-log_ratio)
+
+        # Convert to USD if quote is WETH
+        if quote_token == "WETH" and self._eth_price_usd:
+            spot_price *= self._eth_price_usd
+            twap_price *= self._eth_price_usd
+
+        # Calculate deviation (expm1 keeps precision when prices are close)
+        deviation = abs(math.expm1(log_ratio)) * 100
+
+        return TWAPPrice(
+            symbol=symbol,
+            price=twap_price,
+            twap_seconds=twap_seconds,
+            spot_price=spot_price,
+            deviation_percent=deviation,
+            pool_address=pool_address,
+            liquidity=liquidity,
+            timestamp=time.time_ns(),
+        )
+
     async def get_twap(
         self,
         symbol: str,
         twap_seconds: int = DEFAULT_TWAP_SECONDS,
     ) -> TWAPPrice | None:
         """Get TWAP price for a token."""
-        pool_key = f"{symbol}-WETH"
-        pool_data = UNISWAP_V3_POOLS.get(pool_key)
-
-        if not pool_data:
-            # Try USDC pair
-            pool_key = f"{symbol}-USDC"
-            pool_data = UNISWAP_V3_POOLS.get(pool_key)
+        pool_data = _resolve_pool(symbol)
 
         if not pool_data:
             logger.warning(f"No Uniswap V3 pool found for {symbol}")
             return None
 
-        pool_address, quote_token, fee_tier, token0_is_base = pool_data
-
         try:
-            pool = self._web3.eth.contract(
-                address=AsyncWeb3.to_checksum_address(pool_address),
-                abi=UNISWAP_V3_POOL_ABI,
-            )
+            # Repeated lookups within the same block reuse the previous result
+            block_number = await self._get_block_number()
+            cache_key = (symbol, block_number, twap_seconds)
+            cached = self._get_cached_twap(cache_key)
+            if cached is not None:
+                return cached
+
+            pool = self._get_pool_contract(pool_data[0])
 
             # Get current slot0 for spot price
             slot0 = await pool.functions.slot0().call()
-            current_tick = slot0[1]
 
             # Get TWAP using observe
             seconds_agos = [twap_seconds, 0]
             observations = await pool.functions.observe(seconds_agos).call()
-            tick_cumulatives = observations[0]
-
-            # Calculate TWAP tick
-            twap_tick = (tick_cumulatives[1] - tick_cumulatives[0]) // twap_seconds
 
             # Get pool liquidity
             liquidity = await pool.functions.liquidity().call()
 
-            # Determine decimals based on tokens
-            if quote_token == "USDC" or quote_token == "USDT":
-                quote_decimals = 6
-            else:
-                quote_decimals = 18
-
-            base_decimals = 18  # Most tokens are 18 decimals
-            if symbol == "WBTC":
-                base_decimals = 8
-            elif symbol in ["USDC", "USDT"]:
-                base_decimals = 6
-
-            # Calculate prices
-            spot_price = self._tick_to_price(current_tick, base_decimals, quote_decimals)
-            twap_price = self._tick_to_price(twap_tick, base_decimals, quote_decimals)
-
-            # Invert if needed (token0 is quote)
-            if not token0_is_base:
-                spot_price = 1 / spot_price if spot_price > 0 else 0
-                twap_price = 1 / twap_price if twap_price > 0 else 0
-
-            # Convert to USD if quote is WETH
-            if quote_token == "WETH" and self._eth_price_usd:
-                spot_price *= self._eth_price_usd
-                twap_price *= self._eth_price_usd
-
-            # Calculate deviation
-            deviation = abs(spot_price - twap_price) / twap_price * 100 if twap_price > 0 else 0
-
-            return TWAPPrice(
-                symbol=symbol,
-                price=twap_price,
-                twap_seconds=twap_seconds,
-                spot_price=spot_price,
-                deviation_percent=deviation,
-                pool_address=pool_address,
-                liquidity=liquidity,
-                timestamp=datetime.utcnow(),
+            twap = self._build_twap(
+                symbol, pool_data, twap_seconds, slot0, observations, liquidity
             )
+            return self._cache_twap(cache_key, twap)
 
         except Exception as e:
             logger.error(f"Error fetching Uniswap TWAP for {symbol}: {e}")
             return None
 
+    async def get_twap_many(
+        self,
+        symbols: List[str],
+        twap_seconds: int = DEFAULT_TWAP_SECONDS,
+    ) -> List[TWAPPrice | None]:
+        """Get TWAP prices for several tokens in a single JSON-RPC batch.
+
+        Pool reads for every uncached symbol are sent in one HTTP payload.
+        If the provider rejects batching, falls back to concurrent get_twap calls.
+
+        Returns:
+            List of TWAPPrice (or None) in the same order as symbols
+        """
+        results: List[TWAPPrice | None] = [None] * len(symbols)
+        pending = []  # (index, symbol, pool_data, cache_key)
+
+        try:
+            # Fetched before batching starts, otherwise it would join the batch
+            block_number = await self._get_block_number()
+
+            async with self._web3.batch_requests() as batch:
+                for i, symbol in enumerate(symbols):
+                    pool_data = _resolve_pool(symbol)
+                    if not pool_data:
+                        logger.warning(f"No Uniswap V3 pool found for {symbol}")
+                        continue
+
+                    cache_key = (symbol, block_number, twap_seconds)
+                    cached = self._get_cached_twap(cache_key)
+                    if cached is not None:
+                        results[i] = cached
+                        continue
+
+                    pool = self._get_pool_contract(pool_data[0])
+                    batch.add(pool.functions.slot0())
+                    batch.add(pool.functions.observe([twap_seconds, 0]))
+                    batch.add(pool.functions.liquidity())
+                    pending.append((i, symbol, pool_data, cache_key))
+
+                responses = await batch.async_execute() if pending else []
+
+        except Exception as e:
+            logger.warning(f"Batched TWAP request failed, falling back to individual calls: {e}")
+            return list(await asyncio.gather(
+                *(self.get_twap(symbol, twap_seconds) for symbol in symbols)
+            ))
+
+        for n, (i, symbol, pool_data, cache_key) in enumerate(pending):
+            slot0, observations, liquidity = responses[3 * n:3 * n + 3]
+            try:
+                twap = self._build_twap(
+                    symbol, pool_data, twap_seconds, slot0, observations, liquidity
+                )
+                results[i] = self._cache_twap(cache_key, twap)
+            except Exception as e:
+                logger.error(f"Error fetching Uniswap TWAP for {symbol}: {e}")
+
+        return results
+
     async def get_spot_price(self, symbol: str) -> float | None:
         """Get current spot price (not TWAP)."""
         twap_data = await self.get_twap(symbol, twap_seconds=1)
@@ -215,19 +365,12 @@ class UniswapV3Oracle:
 
     def is_supported(self, symbol: str) -> bool:
         """Check if we have a Uniswap pool for this symbol."""
-        return (
-            f"{symbol}-WETH" in UNISWAP_V3_POOLS
-            or f"{symbol}-USDC" in UNISWAP_V3_POOLS
-            or symbol == "WETH"
-        )
+        return _is_supported(symbol)
 
 
-# Singleton
-_uniswap_oracle: UniswapV3Oracle | None = None
+# Singleton (created at import; the Web3 instance is resolved on first use)
+_uniswap_oracle = UniswapV3Oracle()
 
 
 def get_uniswap_oracle() -> UniswapV3Oracle:
-    global _uniswap_oracle
-    if _uniswap_oracle is None:
-        _uniswap_oracle = UniswapV3Oracle()
     return _uniswap_oracle
@@ -1,6 +1,30 @@
+import os
+from datetime import datetime
+
 import pytest
 
+import app.core.cascade as cascade_module
 import app.services.cache as cache_module
+from app.services.cache import get_position_cache
+
+FROZEN_NOW = datetime(2025, 1, 1)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked @pytest.mark.chain(name) unless <NAME>_RPC_URL or <NAME>_IPC_PATH is set."""
+    for item in items:
+        marker = item.get_closest_marker("chain")
+        if marker is None:
+            continue
+        chain = marker.args[0].upper()
+        if not (os.getenv(f"{chain}_RPC_URL") or os.getenv(f"{chain}_IPC_PATH")):
+            item.add_marker(pytest.mark.skip(reason=f"No {chain}_RPC_URL or {chain}_IPC_PATH configured"))
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def utcnow(cls):
+        return FROZEN_NOW
 
 
 @pytest.fixture(autouse=True)
@@ -11,3 +35,30 @@ def reset_position_cache():
     yield
     cache_module._position_cache = None
     cache_module._reserve_cache = None
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch):
+    """Pin datetime.utcnow() in the cascade detector to FROZEN_NOW."""
+    monkeypatch.setattr(cascade_module, "datetime", _FrozenDatetime)
+    return FROZEN_NOW
+
+
+@pytest.fixture(scope="session")
+def get_adapter():
+    """Return a factory that builds each (adapter class, chain) once per session.
+
+    Shared by every test module so contract setup and provider construction
+    happen once per chain for the whole run.
+    """
+    adapters = {}
+
+    def factory(adapter_cls, chain: str):
+        adapter = adapters.get((adapter_cls, chain))
+        if adapter is None:
+            adapter = adapters[(adapter_cls, chain)] = adapter_cls(chain=chain)
+        # Rebind to the current test's position cache (reset between tests)
+        adapter._position_cache = get_position_cache()
+        return adapter
+
+    return factory
@@ -1,17 +1,112 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+from eth_abi import encode
+from web3 import AsyncWeb3
 
 from app.protocols.aave_v3 import AaveV3Adapter
 from app.protocols.compound_v3 import CompoundV3Adapter
+from app.services.multicall import CallResult
 
 
-class TestAaveV3Adapter:
-    @pytest.fixture
-    def mock_web3(self):
-        web3 = MagicMock()
-        web3.eth = MagicMock()
-        return web3
+def make_user_account_mock(response: tuple) -> MagicMock:
+    """Aave pool contract mock whose getUserAccountData(...).call() returns response."""
+    contract = MagicMock()
+    contract.functions.getUserAccountData.return_value.call = AsyncMock(return_value=response)
+    return contract
+
+
+def make_liquidatable_mock(result: bool) -> MagicMock:
+    """Comet contract mock whose isLiquidatable(...).call() returns result."""
+    contract = MagicMock()
+    contract.functions.isLiquidatable.return_value.call = AsyncMock(return_value=result)
+    return contract
+
+
+class FakeBatch:
+    """Stand-in for web3's async request batcher; answers each added call via respond."""
+
+    def __init__(self, respond):
+        self.calls = []
+        self._respond = respond
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def add(self, call):
+        self.calls.append(call)
+
+    async def async_execute(self):
+        return [self._respond(call) for call in self.calls]
+
+
+def patch_batch_requests(monkeypatch, web3, respond) -> list:
+    """Route web3.batch_requests() to FakeBatch instances; returns the list of batches opened."""
+    batches = []
+
+    def batch_requests():
+        batch = FakeBatch(respond)
+        batches.append(batch)
+        return batch
+
+    monkeypatch.setattr(web3, "batch_requests", batch_requests)
+    return batches
 
+
+def make_call_recorder(*function_names: str) -> MagicMock:
+    """Contract mock whose named functions return (name, *args) for FakeBatch to answer."""
+    contract = MagicMock()
+    for name in function_names:
+        getattr(contract.functions, name).side_effect = lambda *args, name=name: (name, *args)
+    return contract
+
+
+WALLET = "0x1234567890123456789012345678901234567890"
+EMPTY_WALLET = "0x" + "ab" * 20
+OTHER_WALLET = "0x" + "cd" * 20
+
+AAVE_ACCOUNT_DATA = (100000000000, 50000000000, 20000000000, 8000, 7500, 2000000000000000000)
+
+# Compound market with a single collateral asset: 1 token at $2000 against 1000 USDC of debt
+COLLATERAL_TOKEN = "0x" + "11" * 20
+PRICE_FEED = "0x" + "22" * 20
+ASSET_INFO = (0, COLLATERAL_TOKEN, PRICE_FEED, 10**18, 8 * 10**17, 9 * 10**17, 10**18, 10**24)
+COLLATERAL_PRICE = 2000 * 10**8
+BORROW_BALANCE = 1000 * 10**6
+COLLATERAL_BALANCE = 10**18
+
+
+def answer_comet_call(call: tuple):
+    """Comet reads for the market above; only WALLET has a position."""
+    name, *args = call
+    has_position = bool(args) and str(args[0]).lower() == WALLET
+    if name == "getAssetInfo":
+        return ASSET_INFO
+    if name == "getPrice":
+        return COLLATERAL_PRICE
+    if name == "borrowBalanceOf":
+        return BORROW_BALANCE if has_position else 0
+    if name == "collateralBalanceOf":
+        return COLLATERAL_BALANCE if has_position else 0
+    return 0
+
+
+@pytest.fixture(scope="module")
+def mock_web3():
+    return Mock(spec=AsyncWeb3)
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_web3(mock_web3):
+    """Give each test a clean web3 mock; contracts built from it would otherwise be shared."""
+    mock_web3.reset_mock()
+    mock_web3.eth = MagicMock()
+
+
+class TestAaveV3Adapter:
     @pytest.fixture
     def adapter(self, mock_web3):
         return AaveV3Adapter(chain="ethereum", web3=mock_web3)
@@ -38,7 +133,6 @@ class TestAaveV3Adapter:
         with pytest.raises(ValueError, match="Unsupported chain"):
             AaveV3Adapter(chain="polygon", web3=mock_web3)
 
-    @pytest.mark.asyncio
     async def test_get_position_with_data(self, adapter):
         # Mock contract call response
         # Format: (totalCollateralBase, totalDebtBase, availableBorrowsBase,
@@ -52,11 +146,7 @@ class TestAaveV3Adapter:
             2000000000000000000,  # 2.0 HF (18 decimals)
         )
 
-        contract_mock = MagicMock()
-        contract_mock.functions.getUserAccountData.return_value.call = AsyncMock(
-            return_value=mock_response
-        )
-        adapter._pool_contract = contract_mock
+        adapter._pool_contract = make_user_account_mock(mock_response)
 
         position = await adapter.get_position(
             "0x1234567890123456789012345678901234567890"
@@ -69,14 +159,95 @@ class TestAaveV3Adapter:
         assert position.health_factor == 2.0
         assert position.liquidation_threshold == 0.8
 
-    @pytest.mark.asyncio
+    async def test_get_position_uses_cache(self, adapter):
+        mock_response = (100000000000, 50000000000, 20000000000, 8000, 7500, 2000000000000000000)
+        adapter._pool_contract = make_user_account_mock(mock_response)
+        address = "0x1234567890123456789012345678901234567890"
+
+        first = await adapter.get_position(address)
+        second = await adapter.get_position(address)
+
+        assert second is first
+        assert adapter._pool_contract.functions.getUserAccountData.return_value.call.await_count == 1
+
+    async def test_get_position_bytes_shares_cache(self, adapter):
+        mock_response = (100000000000, 50000000000, 20000000000, 8000, 7500, 2000000000000000000)
+        adapter._pool_contract = make_user_account_mock(mock_response)
+        address = bytes.fromhex("1234567890123456789012345678901234567890")
+
+        position = await adapter.get_position_bytes(address)
+
+        adapter._pool_contract.functions.getUserAccountData.assert_called_once_with(address)
+        assert position.wallet_address == "0x1234567890123456789012345678901234567890"
+        assert await adapter.get_position("0x1234567890123456789012345678901234567890") is position
+
+    async def test_get_positions_multicall(self, adapter, monkeypatch):
+        adapter._pool_contract = MagicMock(address="0x87870Bca3F3fD6335C3F4ce8392D69350B4fA4E2")
+        account_data = encode(["uint256"] * 6, [100000000000, 50000000000, 20000000000, 8000, 7500, 2 * 10**18])
+        execute = AsyncMock(return_value=[
+            CallResult(success=True, return_data=account_data),
+            CallResult(success=False, return_data=b""),
+        ])
+        monkeypatch.setattr(adapter._multicall, "execute", execute)
+        wallet = "0x1234567890123456789012345678901234567890"
+        other = "0x" + "ab" * 20
+
+        positions = await adapter.get_positions([wallet, other, wallet])
+
+        assert execute.await_count == 1
+        assert len(execute.await_args.args[0]) == 2  # duplicate wallet read once
+        assert positions[0] is positions[2]
+        assert positions[0].health_factor == 2.0
+        assert positions[1] is None
+
+    async def test_get_positions_multicall_all_failed_falls_back(self, adapter, monkeypatch):
+        adapter._pool_contract = MagicMock(address="0x87870Bca3F3fD6335C3F4ce8392D69350B4fA4E2")
+        monkeypatch.setattr(
+            adapter._multicall, "execute",
+            AsyncMock(return_value=[CallResult(success=False, return_data=b"")]),
+        )
+        get_positions_batch = AsyncMock(return_value=[None])
+        monkeypatch.setattr(adapter, "get_positions_batch", get_positions_batch)
+
+        positions = await adapter.get_positions([WALLET])
+
+        get_positions_batch.assert_awaited_once_with([WALLET])
+        assert positions == [None]
+
+    async def test_get_positions_batch(self, adapter, mock_web3, monkeypatch):
+        adapter._pool_contract = make_call_recorder("getUserAccountData")
+        batches = patch_batch_requests(
+            monkeypatch, mock_web3,
+            lambda call: (0,) * 6 if call[1].lower() == EMPTY_WALLET else AAVE_ACCOUNT_DATA,
+        )
+        monkeypatch.setattr(adapter, "BATCH_CHUNK_SIZE", 2)
+
+        positions = await adapter.get_positions_batch([WALLET, EMPTY_WALLET, WALLET, OTHER_WALLET])
+
+        # Three distinct wallets split over two batches; the duplicate is read once
+        assert [len(batch.calls) for batch in batches] == [2, 1]
+        assert positions[0] is positions[2]
+        assert positions[0].health_factor == 2.0
+        assert positions[1] is None
+        assert positions[3].wallet_address == OTHER_WALLET
+        assert await adapter.get_position(WALLET) is positions[0]
+
+    async def test_get_positions_batch_falls_back(self, adapter, mock_web3, monkeypatch):
+        adapter._pool_contract = make_user_account_mock(AAVE_ACCOUNT_DATA)
+
+        def reject(call):
+            raise ValueError("batch requests not supported")
+
+        patch_batch_requests(monkeypatch, mock_web3, reject)
+
+        positions = await adapter.get_positions_batch([WALLET, OTHER_WALLET])
+
+        assert [position.wallet_address for position in positions] == [WALLET, OTHER_WALLET]
+        assert adapter._pool_contract.functions.getUserAccountData.return_value.call.await_count == 2
+
     async def test_get_position_no_data(self, adapter):
         mock_response = (0, 0, 0, 0, 0, 0)
-        contract_mock = MagicMock()
-        contract_mock.functions.getUserAccountData.return_value.call = AsyncMock(
-            return_value=mock_response
-        )
-        adapter._pool_contract = contract_mock
+        adapter._pool_contract = make_user_account_mock(mock_response)
 
         position = await adapter.get_position(
             "0x1234567890123456789012345678901234567890"
@@ -84,7 +255,6 @@ class TestAaveV3Adapter:
 
         assert position is None
 
-    @pytest.mark.asyncio
     async def test_has_position(self, adapter):
         mock_response = (
             100000000000,
@@ -94,11 +264,7 @@ class TestAaveV3Adapter:
             7500,
             2000000000000000000,
         )
-        contract_mock = MagicMock()
-        contract_mock.functions.getUserAccountData.return_value.call = AsyncMock(
-            return_value=mock_response
-        )
-        adapter._pool_contract = contract_mock
+        adapter._pool_contract = make_user_account_mock(mock_response)
 
         has_pos = await adapter.has_position(
             "0x1234567890123456789012345678901234567890"
@@ -108,12 +274,6 @@ class TestAaveV3Adapter:
 
 
 class TestCompoundV3Adapter:
-    @pytest.fixture
-    def mock_web3(self):
-        web3 = MagicMock()
-        web3.eth = MagicMock()
-        return web3
-
     @pytest.fixture
     def adapter(self, mock_web3):
         return CompoundV3Adapter(chain="ethereum", web3=mock_web3)
@@ -140,13 +300,95 @@ class TestCompoundV3Adapter:
         with pytest.raises(ValueError, match="Unsupported chain"):
             CompoundV3Adapter(chain="polygon", web3=mock_web3)
 
-    @pytest.mark.asyncio
-    async def test_is_liquidatable(self, adapter):
-        contract_mock = MagicMock()
-        contract_mock.functions.isLiquidatable.return_value.call = AsyncMock(
-            return_value=False
+    async def test_get_position_uses_cache(self, adapter):
+        comet = MagicMock()
+        comet.functions.borrowBalanceOf.return_value.call = AsyncMock(return_value=500_000_000)
+        comet.functions.balanceOf.return_value.call = AsyncMock(return_value=0)
+        comet.functions.numAssets.return_value.call = AsyncMock(return_value=0)
+        adapter._comet_contract = comet
+        address = "0x1234567890123456789012345678901234567890"
+
+        first = await adapter.get_position(address)
+        second = await adapter.get_position(address)
+
+        assert first is not None
+        assert second is first
+        assert comet.functions.borrowBalanceOf.return_value.call.await_count == 1
+
+    async def test_get_positions_multicall(self, adapter, monkeypatch):
+        adapter._comet_contract.functions.numAssets.return_value.call = AsyncMock(return_value=1)
+
+        def results(*values) -> list:
+            return [CallResult(success=True, return_data=encode(["uint256"], [v])) for v in values]
+
+        execute = AsyncMock(side_effect=[
+            [CallResult(success=True, return_data=encode([adapter.ASSET_INFO_TYPE], [ASSET_INFO]))],
+            results(COLLATERAL_PRICE),
+            # borrowBalanceOf, balanceOf, collateralBalanceOf for each distinct wallet
+            results(BORROW_BALANCE, 0, COLLATERAL_BALANCE, 0, 0, 0),
+        ])
+        monkeypatch.setattr(adapter._multicall, "execute", execute)
+
+        positions = await adapter.get_positions([WALLET, EMPTY_WALLET, WALLET])
+
+        assert execute.await_count == 3
+        assert len(execute.await_args.args[0]) == 6  # duplicate wallet read once
+        assert positions[0] is positions[2]
+        assert positions[0].health_factor == pytest.approx(1.8)
+        assert positions[0].total_collateral_usd == pytest.approx(2000.0)
+        assert positions[1] is None
+
+    async def test_get_positions_multicall_all_failed_falls_back(self, adapter, monkeypatch):
+        adapter._comet_contract.functions.numAssets.return_value.call = AsyncMock(return_value=1)
+        monkeypatch.setattr(
+            adapter._multicall, "execute",
+            AsyncMock(return_value=[CallResult(success=False, return_data=b"")]),
+        )
+        get_positions_batch = AsyncMock(return_value=[None])
+        monkeypatch.setattr(adapter, "get_positions_batch", get_positions_batch)
+
+        positions = await adapter.get_positions([WALLET])
+
+        get_positions_batch.assert_awaited_once_with([WALLET])
+        assert positions == [None]
+
+    async def test_get_positions_batch(self, adapter, mock_web3, monkeypatch):
+        comet = make_call_recorder(
+            "getAssetInfo", "getPrice", "borrowBalanceOf", "balanceOf", "collateralBalanceOf"
         )
-        adapter._comet_contract = contract_mock
+        comet.functions.numAssets.return_value.call = AsyncMock(return_value=1)
+        adapter._comet_contract = comet
+        batches = patch_batch_requests(monkeypatch, mock_web3, answer_comet_call)
+        # Three reads per wallet, so each wallet gets its own batch
+        monkeypatch.setattr(adapter, "BATCH_CHUNK_SIZE", 3)
+
+        positions = await adapter.get_positions_batch([WALLET, EMPTY_WALLET, WALLET])
+
+        # Asset info and price batches, then one batch per distinct wallet
+        assert [len(batch.calls) for batch in batches] == [1, 1, 3, 3]
+        assert positions[0] is positions[2]
+        assert positions[0].health_factor == pytest.approx(1.8)
+        assert positions[0].total_debt_usd == 1000.0
+        assert positions[1] is None
+
+    async def test_get_positions_batch_falls_back(self, adapter, mock_web3, monkeypatch):
+        comet = adapter._comet_contract
+        comet.functions.numAssets.return_value.call = AsyncMock(return_value=0)
+        comet.functions.borrowBalanceOf.return_value.call = AsyncMock(return_value=500_000_000)
+        comet.functions.balanceOf.return_value.call = AsyncMock(return_value=0)
+
+        def reject(call):
+            raise ValueError("batch requests not supported")
+
+        patch_batch_requests(monkeypatch, mock_web3, reject)
+
+        positions = await adapter.get_positions_batch([WALLET, OTHER_WALLET])
+
+        assert [position.wallet_address for position in positions] == [WALLET, OTHER_WALLET]
+        assert comet.functions.borrowBalanceOf.return_value.call.await_count == 2
+
+    async def test_is_liquidatable(self, adapter):
+        adapter._comet_contract = make_liquidatable_mock(False)
 
         is_liq = await adapter.is_liquidatable(
             "0x1234567890123456789012345678901234567890"
@@ -1,11 +1,13 @@
 """Tests for the gas-aware alerter system."""
 
+import asyncio
+import time
+
 import pytest
-from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock
 
 from app.protocols.base import Position
 from app.core.health import HealthStatus, HealthAssessment
+from app.services.cache import make_position_key
 from app.core.alerter import (
     GasAwareAlerter,
     AlertRecord,
@@ -24,8 +26,8 @@ def create_position(
         protocol=protocol,
         wallet_address=wallet_address,
         health_factor=health_factor,
-        collateral_assets=[],
-        debt_assets=[],
+        collateral_assets=(),
+        debt_assets=(),
         total_collateral_usd=total_collateral_usd,
         total_debt_usd=total_debt_usd,
         liquidation_threshold=0.8,
@@ -43,6 +45,16 @@ def create_assessment(status: HealthStatus, message: str = "Test", health_factor
     )
 
 
+class FakeBot:
+    """Minimal async stand-in for telegram.Bot that records sent messages."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def send_message(self, **kwargs):
+        self.calls.append(kwargs)
+
+
 class TestHealthHistory:
     def test_add_and_get(self):
         history = HealthHistory()
@@ -83,16 +95,13 @@ class TestHealthHistory:
 
         # Add entries spanning the time window
         # First entry outside the window
-        history.timestamps.append(datetime.utcnow() - timedelta(minutes=90))
-        history.health_factors.append(2.5)
+        history.add(2.5, timestamp=time.monotonic() - 90 * 60)
 
         # Second entry just at the start of window
-        history.timestamps.append(datetime.utcnow() - timedelta(minutes=59))
-        history.health_factors.append(2.0)
+        history.add(2.0, timestamp=time.monotonic() - 59 * 60)
 
         # Current entry
-        history.timestamps.append(datetime.utcnow())
-        history.health_factors.append(1.6)
+        history.add(1.6)
 
         rate = history.get_deterioration_rate(window_minutes=60)
         # Rate could be None if algorithm doesn't find old entry in window
@@ -104,9 +113,7 @@ class TestHealthHistory:
 class TestGasAwareAlerter:
     @pytest.fixture
     def mock_bot(self):
-        bot = MagicMock()
-        bot.send_message = AsyncMock()
-        return bot
+        return FakeBot()
 
     @pytest.fixture
     def alerter(self, mock_bot):
@@ -114,21 +121,21 @@ class TestGasAwareAlerter:
 
     def test_get_alert_key(self, alerter):
         key = alerter._get_alert_key(12345, "0xabc", "Aave V3")
-        assert key == "12345:0xabc:Aave V3"
+        assert key == (12345, ("0xabc", "Aave V3"))
 
     def test_should_alert_first_time(self, alerter):
-        key = "new_key"
+        key = alerter._get_alert_key(12345, "0xabc", "Aave")
         should, reason = alerter._should_alert(key, HealthStatus.WARNING, 1.3)
 
         assert should is True
         assert reason == "first_alert"
 
     def test_should_alert_status_worsened(self, alerter):
-        key = "test_key"
-        alerter._alert_history[key] = AlertRecord(
+        key = alerter._get_alert_key(12345, "0xabc", "Aave")
+        alerter._alert_history[12345][key[1]] = AlertRecord(
             status=HealthStatus.WARNING,
             health_factor=1.3,
-            last_alert_time=datetime.utcnow(),
+            last_alert_time=time.monotonic(),
             alert_count=1,
         )
 
@@ -138,11 +145,11 @@ class TestGasAwareAlerter:
         assert reason == "status_worsened"
 
     def test_should_alert_significant_hf_drop(self, alerter):
-        key = "test_key"
-        alerter._alert_history[key] = AlertRecord(
+        key = alerter._get_alert_key(12345, "0xabc", "Aave")
+        alerter._alert_history[12345][key[1]] = AlertRecord(
             status=HealthStatus.WARNING,
             health_factor=1.5,
-            last_alert_time=datetime.utcnow(),
+            last_alert_time=time.monotonic(),
             alert_count=1,
         )
 
@@ -153,11 +160,11 @@ class TestGasAwareAlerter:
         assert reason == "significant_hf_drop"
 
     def test_should_not_alert_cooldown(self, alerter):
-        key = "test_key"
-        alerter._alert_history[key] = AlertRecord(
+        key = alerter._get_alert_key(12345, "0xabc", "Aave")
+        alerter._alert_history[12345][key[1]] = AlertRecord(
             status=HealthStatus.WARNING,
             health_factor=1.3,
-            last_alert_time=datetime.utcnow(),
+            last_alert_time=time.monotonic(),
             alert_count=1,
         )
 
@@ -168,11 +175,11 @@ class TestGasAwareAlerter:
         assert reason is None
 
     def test_should_alert_cooldown_expired(self, alerter):
-        key = "test_key"
-        alerter._alert_history[key] = AlertRecord(
+        key = alerter._get_alert_key(12345, "0xabc", "Aave")
+        alerter._alert_history[12345][key[1]] = AlertRecord(
             status=HealthStatus.WARNING,
             health_factor=1.3,
-            last_alert_time=datetime.utcnow() - timedelta(hours=2),  # Past 1h cooldown
+            last_alert_time=time.monotonic() - 2 * 60 * 60,  # Past 1h cooldown
             alert_count=1,
         )
 
@@ -205,7 +212,6 @@ class TestGasAwareAlerter:
         assert is_economical is False
         # Gas cost ($80) > 5% of position ($5)
 
-    @pytest.mark.asyncio
     async def test_check_and_alert_healthy_no_alert(self, alerter):
         position = create_position(health_factor=3.0)
         assessment = create_assessment(HealthStatus.HEALTHY)
@@ -213,9 +219,8 @@ class TestGasAwareAlerter:
         result = await alerter.check_and_alert(12345, position, assessment)
 
         assert result is False
-        alerter._bot.send_message.assert_not_called()
+        assert not alerter._bot.calls
 
-    @pytest.mark.asyncio
     async def test_check_and_alert_warning(self, alerter):
         position = create_position(health_factor=1.3)
         assessment = create_assessment(HealthStatus.WARNING, "Health factor below threshold")
@@ -223,9 +228,8 @@ class TestGasAwareAlerter:
         result = await alerter.check_and_alert(12345, position, assessment)
 
         assert result is True
-        alerter._bot.send_message.assert_called_once()
+        assert len(alerter._bot.calls) == 1
 
-    @pytest.mark.asyncio
     async def test_check_and_alert_with_gas_info(self, alerter):
         position = create_position(health_factor=1.05)
         assessment = create_assessment(HealthStatus.CRITICAL, "Critical health factor")
@@ -239,26 +243,86 @@ class TestGasAwareAlerter:
         )
 
         assert result is True
-        alerter._bot.send_message.assert_called_once()
+        assert len(alerter._bot.calls) == 1
+
+    async def test_dedup_same_alert_within_ttl(self, alerter):
+        position = create_position(health_factor=1.05)
+        assessment = create_assessment(HealthStatus.CRITICAL, "Critical health factor")
+
+        first = await alerter.check_and_alert(12345, position, assessment)
+        # Drop the alert record so only the dedup window can suppress the repeat
+        alerter.clear_alert_history(12345)
+        second = await alerter.check_and_alert(12345, position, assessment)
+
+        assert first is True
+        assert second is False
+        assert len(alerter._bot.calls) == 1
+
+    async def test_dedup_still_records_health_history(self, alerter):
+        position = create_position(health_factor=1.05)
+        assessment = create_assessment(HealthStatus.CRITICAL, "Critical health factor")
+
+        await alerter.check_and_alert(12345, position, assessment)
+        alerter.clear_alert_history(12345)
+        await alerter.check_and_alert(12345, position, assessment)
+
+        history = alerter._health_history[make_position_key(position.wallet_address, position.protocol)]
+        assert history.health_factors == [1.05, 1.05]
+
+    async def test_healthy_check_records_no_fingerprint(self, alerter):
+        position = create_position(health_factor=2.5)
+        assessment = create_assessment(HealthStatus.HEALTHY, "Healthy")
+
+        await alerter.check_and_alert(12345, position, assessment)
+
+        assert alerter._dedup == {}
+
+    async def test_check_and_alert_many_sends_concurrently(self, alerter):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def send_message(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        alerter._bot.send_message = send_message
+        items = [
+            (
+                12345,
+                create_position(wallet_address=f"0x{i:040x}", health_factor=1.3),
+                create_assessment(HealthStatus.WARNING),
+            )
+            for i in range(alerter.MAX_CONCURRENT_ALERTS + 8)
+        ]
+
+        results = await alerter.check_and_alert_many(items)
+
+        assert results == [True] * len(items)
+        assert 1 < max_in_flight <= alerter.MAX_CONCURRENT_ALERTS
 
     def test_clear_alert_history(self, alerter):
-        alerter._alert_history = {
-            "12345:0xabc:Aave": AlertRecord(
+        alerter._alert_history[12345] = {
+            ("0xabc", "Aave"): AlertRecord(
                 status=HealthStatus.WARNING,
                 health_factor=1.3,
-                last_alert_time=datetime.utcnow(),
+                last_alert_time=time.monotonic(),
                 alert_count=1,
             ),
-            "12345:0xdef:Compound": AlertRecord(
+            ("0xdef", "Compound"): AlertRecord(
                 status=HealthStatus.CRITICAL,
                 health_factor=1.05,
-                last_alert_time=datetime.utcnow(),
+                last_alert_time=time.monotonic(),
                 alert_count=2,
             ),
-            "67890:0xghi:Aave": AlertRecord(
+        }
+        alerter._alert_history[67890] = {
+            ("0xghi", "Aave"): AlertRecord(
                 status=HealthStatus.WARNING,
                 health_factor=1.4,
-                last_alert_time=datetime.utcnow(),
+                last_alert_time=time.monotonic(),
                 alert_count=1,
             ),
         }
@@ -266,27 +330,26 @@ class TestGasAwareAlerter:
         # Clear history for chat_id 12345
         alerter.clear_alert_history(12345)
 
-        assert "12345:0xabc:Aave" not in alerter._alert_history
-        assert "12345:0xdef:Compound" not in alerter._alert_history
-        assert "67890:0xghi:Aave" in alerter._alert_history
+        assert 12345 not in alerter._alert_history
+        assert ("0xghi", "Aave") in alerter._alert_history[67890]
 
     def test_clear_alert_history_specific_wallet(self, alerter):
-        alerter._alert_history = {
-            "12345:0xabc:Aave": AlertRecord(
+        alerter._alert_history[12345] = {
+            ("0xabc", "Aave"): AlertRecord(
                 status=HealthStatus.WARNING,
                 health_factor=1.3,
-                last_alert_time=datetime.utcnow(),
+                last_alert_time=time.monotonic(),
                 alert_count=1,
             ),
-            "12345:0xdef:Compound": AlertRecord(
+            ("0xdef", "Compound"): AlertRecord(
                 status=HealthStatus.CRITICAL,
                 health_factor=1.05,
-                last_alert_time=datetime.utcnow(),
+                last_alert_time=time.monotonic(),
                 alert_count=2,
             ),
         }
 
         alerter.clear_alert_history(12345, "0xabc")
 
-        assert "12345:0xabc:Aave" not in alerter._alert_history
-        assert "12345:0xdef:Compound" in alerter._alert_history
+        assert ("0xabc", "Aave") not in alerter._alert_history[12345]
+        assert ("0xdef", "Compound") in alerter._alert_history[12345]
@@ -22,8 +22,8 @@ def create_position(
         protocol="Test",
         wallet_address="0x1234567890123456789012345678901234567890",
         health_factor=health_factor,
-        collateral_assets=[],
-        debt_assets=[],
+        collateral_assets=(),
+        debt_assets=(),
         total_collateral_usd=total_collateral_usd,
         total_debt_usd=total_debt_usd,
         liquidation_threshold=liquidation_threshold,
@@ -164,13 +164,14 @@ class TestRunStressTest:
 
         assert len(results) > 0
         assert all(isinstance(r, PriceSimulation) for r in results)
+        assert len(results.to_list()) == len(results)
 
     def test_stress_test_includes_various_drops(self):
         position = create_position()
         results = run_stress_test(position)
 
         # Should include different price drop scenarios
-        drops = [r.price_change_percent for r in results]
+        drops = list(results.price_change_percent)
         assert -10 in drops or any(d < 0 for d in drops)
         assert -50 in drops or any(d <= -50 for d in drops)
 
@@ -178,6 +179,6 @@ class TestRunStressTest:
         position = create_position()
         results = run_stress_test(position)
 
-        drops = [r.price_change_percent for r in results]
+        drops = list(results.price_change_percent)
         # Results should be in some order (ascending or descending)
         assert drops == sorted(drops) or drops == sorted(drops, reverse=True)
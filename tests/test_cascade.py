@@ -1,10 +1,11 @@
 """Tests for liquidation cascade detection."""
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.core.cascade import (
+    LIQUIDATION_EVENTS,
     LiquidationEvent,
     CascadeAlert,
     LiquidationCascadeDetector,
@@ -20,10 +21,10 @@ class TestLiquidationCascadeDetector:
 
     def test_init(self, detector):
         assert detector._recent_liquidations == {}
-        assert detector._last_checked_block == {}
+        assert list(detector._last_checked_block) == [0] * len(LIQUIDATION_EVENTS)
         assert detector._alert_history == {}
 
-    def test_cleanup_old_events(self, detector):
+    def test_cleanup_old_events(self, detector, frozen_now):
         protocol = "Aave V3"
 
         # Add old and new events
@@ -35,7 +36,7 @@ class TestLiquidationCascadeDetector:
             borrower="0xdef",
             debt_covered_usd=1000,
             collateral_seized_usd=1100,
-            timestamp=datetime.utcnow() - timedelta(hours=2),
+            timestamp=frozen_now - timedelta(hours=2),
         )
 
         new_event = LiquidationEvent(
@@ -46,21 +47,23 @@ class TestLiquidationCascadeDetector:
             borrower="0xghi",
             debt_covered_usd=2000,
             collateral_seized_usd=2200,
-            timestamp=datetime.utcnow(),
+            timestamp=frozen_now,
         )
 
-        detector._recent_liquidations[protocol] = [old_event, new_event]
+        detector.add_event(protocol, old_event)
+        detector.add_event(protocol, new_event)
         detector._cleanup_old_events(protocol)
 
         # Old event should be removed
         assert len(detector._recent_liquidations[protocol]) == 1
         assert detector._recent_liquidations[protocol][0].tx_hash == "0x456"
+        assert detector.get_stats()[protocol]["total_value_usd"] == 2000
 
     def test_detect_cascade_no_events(self, detector):
         result = detector._detect_cascade("Aave V3")
         assert result is None
 
-    def test_detect_cascade_below_threshold(self, detector):
+    def test_detect_cascade_below_threshold(self, detector, frozen_now):
         protocol = "Aave V3"
 
         # Add 3 events (below warning threshold of 5)
@@ -73,17 +76,18 @@ class TestLiquidationCascadeDetector:
                 borrower=f"0x{i}",
                 debt_covered_usd=10000,
                 collateral_seized_usd=11000,
-                timestamp=datetime.utcnow(),
+                timestamp=frozen_now,
             )
             for i in range(3)
         ]
 
-        detector._recent_liquidations[protocol] = events
+        for event in events:
+            detector.add_event(protocol, event)
         result = detector._detect_cascade(protocol)
 
         assert result is None
 
-    def test_detect_cascade_warning_by_count(self, detector):
+    def test_detect_cascade_warning_by_count(self, detector, frozen_now):
         protocol = "Aave V3"
 
         # Add 6 events (above warning threshold of 5)
@@ -96,19 +100,20 @@ class TestLiquidationCascadeDetector:
                 borrower=f"0x{i}",
                 debt_covered_usd=10000,
                 collateral_seized_usd=11000,
-                timestamp=datetime.utcnow(),
+                timestamp=frozen_now,
             )
             for i in range(6)
         ]
 
-        detector._recent_liquidations[protocol] = events
+        for event in events:
+            detector.add_event(protocol, event)
         result = detector._detect_cascade(protocol)
 
         assert result is not None
         assert result.severity == "warning"
         assert result.liquidation_count == 6
 
-    def test_detect_cascade_critical_by_value(self, detector):
+    def test_detect_cascade_critical_by_value(self, detector, frozen_now):
         protocol = "Aave V3"
 
         # Add 3 events with high value (above critical threshold of $5M)
@@ -121,19 +126,20 @@ class TestLiquidationCascadeDetector:
                 borrower=f"0x{i}",
                 debt_covered_usd=2_000_000,  # $2M each
                 collateral_seized_usd=2_200_000,
-                timestamp=datetime.utcnow(),
+                timestamp=frozen_now,
             )
             for i in range(3)
         ]
 
-        detector._recent_liquidations[protocol] = events
+        for event in events:
+            detector.add_event(protocol, event)
         result = detector._detect_cascade(protocol)
 
         assert result is not None
         assert result.severity == "critical"
         assert result.total_value_usd == 6_000_000
 
-    def test_detect_cascade_severe(self, detector):
+    def test_detect_cascade_severe(self, detector, frozen_now):
         protocol = "Aave V3"
 
         # Add 25 events (above severe threshold of 20)
@@ -146,18 +152,19 @@ class TestLiquidationCascadeDetector:
                 borrower=f"0x{i}",
                 debt_covered_usd=100_000,
                 collateral_seized_usd=110_000,
-                timestamp=datetime.utcnow(),
+                timestamp=frozen_now,
             )
             for i in range(25)
         ]
 
-        detector._recent_liquidations[protocol] = events
+        for event in events:
+            detector.add_event(protocol, event)
         result = detector._detect_cascade(protocol)
 
         assert result is not None
         assert result.severity == "severe"
 
-    def test_cascade_alert_cooldown(self, detector):
+    def test_cascade_alert_cooldown(self, detector, frozen_now):
         protocol = "Aave V3"
 
         # Add events above threshold
@@ -170,12 +177,13 @@ class TestLiquidationCascadeDetector:
                 borrower=f"0x{i}",
                 debt_covered_usd=100_000,
                 collateral_seized_usd=110_000,
-                timestamp=datetime.utcnow(),
+                timestamp=frozen_now,
             )
             for i in range(10)
         ]
 
-        detector._recent_liquidations[protocol] = events
+        for event in events:
+            detector.add_event(protocol, event)
 
         # First detection should trigger alert
         result1 = detector._detect_cascade(protocol)
@@ -185,7 +193,7 @@ class TestLiquidationCascadeDetector:
         result2 = detector._detect_cascade(protocol)
         assert result2 is None
 
-    def test_get_recent_liquidations(self, detector):
+    def test_get_recent_liquidations(self, detector, frozen_now):
         protocol = "Aave V3"
         event = LiquidationEvent(
             protocol=protocol,
@@ -195,10 +203,10 @@ class TestLiquidationCascadeDetector:
             borrower="0xdef",
             debt_covered_usd=1000,
             collateral_seized_usd=1100,
-            timestamp=datetime.utcnow(),
+            timestamp=frozen_now,
         )
 
-        detector._recent_liquidations[protocol] = [event]
+        detector.add_event(protocol, event)
         result = detector.get_recent_liquidations(protocol)
 
         assert len(result) == 1
@@ -208,7 +216,7 @@ class TestLiquidationCascadeDetector:
         result = detector.get_recent_liquidations("Unknown Protocol")
         assert result == []
 
-    def test_get_stats(self, detector):
+    def test_get_stats(self, detector, frozen_now):
         protocol = "Aave V3"
         events = [
             LiquidationEvent(
@@ -219,14 +227,47 @@ class TestLiquidationCascadeDetector:
                 borrower=f"0x{i}",
                 debt_covered_usd=1000 * (i + 1),
                 collateral_seized_usd=1100 * (i + 1),
-                timestamp=datetime.utcnow(),
+                timestamp=frozen_now,
             )
             for i in range(3)
         ]
 
-        detector._recent_liquidations[protocol] = events
+        for event in events:
+            detector.add_event(protocol, event)
         stats = detector.get_stats()
 
         assert protocol in stats
         assert stats[protocol]["recent_count"] == 3
         assert stats[protocol]["total_value_usd"] == 6000  # 1000 + 2000 + 3000
+
+    def test_running_value_tracks_evictions(self, detector, frozen_now):
+        protocol = "Aave V3"
+        detector.MAX_RECENT_EVENTS = 2
+
+        detector.add_event(protocol, LiquidationEvent(
+            protocol=protocol,
+            block_number=0,
+            tx_hash="0x0",
+            liquidator="0xabc",
+            borrower="0x0",
+            debt_covered_usd=1000,
+            collateral_seized_usd=1100,
+            timestamp=frozen_now,
+        ))
+        detector.add_events(protocol, [
+            LiquidationEvent(
+                protocol=protocol,
+                block_number=i,
+                tx_hash=f"0x{i}",
+                liquidator="0xabc",
+                borrower=f"0x{i}",
+                debt_covered_usd=1000 * (i + 1),
+                collateral_seized_usd=1100 * (i + 1),
+                timestamp=frozen_now,
+            )
+            for i in range(1, 3)
+        ])
+
+        stats = detector.get_stats()
+        assert stats[protocol]["recent_count"] == 2
+        assert stats[protocol]["total_value_usd"] == 5000  # Oldest event evicted
@@ -20,8 +20,8 @@ def create_position(
         protocol="Test",
         wallet_address="0x1234567890123456789012345678901234567890",
         health_factor=health_factor,
-        collateral_assets=[],
-        debt_assets=[],
+        collateral_assets=(),
+        debt_assets=(),
         total_collateral_usd=total_collateral_usd,
         total_debt_usd=total_debt_usd,
         liquidation_threshold=liquidation_threshold,
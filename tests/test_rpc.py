@@ -0,0 +1,99 @@
+"""Tests for chain Web3 construction and the lazily connected IPC provider."""
+
+import asyncio
+import json
+
+import pytest
+from web3 import AsyncHTTPProvider
+
+from app.config import get_settings
+from app.services.rpc import LazyAsyncIPCProvider, create_chain_web3
+
+
+class FakeNode:
+    """Unix-socket JSON-RPC node answering eth_blockNumber, one JSON message per line."""
+
+    BLOCK_NUMBER = 0x10
+
+    def __init__(self):
+        self.connections = 0
+        self.requests = []
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        while line := await reader.readline():
+            request = json.loads(line)
+            self.requests.append(request["method"])
+            response = {"jsonrpc": "2.0", "id": request["id"], "result": hex(self.BLOCK_NUMBER)}
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+        writer.close()
+
+
+@pytest.fixture
+def ipc_path(tmp_path):
+    return str(tmp_path / "node.ipc")
+
+
+@pytest.fixture
+async def node(ipc_path):
+    node = FakeNode()
+    server = await asyncio.start_unix_server(node.handle, ipc_path)
+    yield node
+    server.close()
+    await server.wait_closed()
+
+
+class TestCreateChainWeb3:
+    def test_http_without_ipc_path(self, monkeypatch):
+        settings = get_settings()
+        monkeypatch.setattr(settings, "ethereum_ipc_path", None)
+
+        web3 = create_chain_web3("ethereum")
+
+        assert isinstance(web3.provider, AsyncHTTPProvider)
+        assert web3.provider.endpoint_uri == settings.get_rpc_url("ethereum")
+
+    def test_prefers_ipc_path(self, monkeypatch, ipc_path):
+        monkeypatch.setattr(get_settings(), "ethereum_ipc_path", ipc_path)
+
+        web3 = create_chain_web3("ethereum")
+
+        assert isinstance(web3.provider, LazyAsyncIPCProvider)
+        assert str(web3.provider.ipc_path) == ipc_path
+
+    def test_ipc_path_is_per_chain(self, monkeypatch, ipc_path):
+        monkeypatch.setattr(get_settings(), "ethereum_ipc_path", ipc_path)
+        monkeypatch.setattr(get_settings(), "arbitrum_ipc_path", None)
+
+        web3 = create_chain_web3("arbitrum")
+
+        assert isinstance(web3.provider, AsyncHTTPProvider)
+
+
+class TestLazyAsyncIPCProvider:
+    async def test_connects_on_first_request(self, monkeypatch, node, ipc_path):
+        monkeypatch.setattr(get_settings(), "ethereum_ipc_path", ipc_path)
+        web3 = create_chain_web3("ethereum")
+        await asyncio.sleep(0)
+        assert node.connections == 0
+
+        try:
+            assert await web3.eth.block_number == FakeNode.BLOCK_NUMBER
+        finally:
+            await web3.provider.disconnect()
+
+        assert node.connections == 1
+
+    async def test_concurrent_first_requests_share_one_connection(self, monkeypatch, node, ipc_path):
+        monkeypatch.setattr(get_settings(), "ethereum_ipc_path", ipc_path)
+        web3 = create_chain_web3("ethereum")
+
+        try:
+            block_numbers = await asyncio.gather(*(web3.eth.block_number for _ in range(10)))
+        finally:
+            await web3.provider.disconnect()
+
+        assert block_numbers == [FakeNode.BLOCK_NUMBER] * 10
+        assert node.connections == 1
+        assert node.requests == ["eth_blockNumber"] * 10
@@ -0,0 +1,146 @@
+"""Tests for the ERC20 token metadata service."""
+
+import os
+import time
+
+import pytest
+from eth_abi import encode
+from eth_utils import to_checksum_address
+
+from app.services.token_metadata import TokenMetadataService, _to_checksum
+
+TOKEN = "0x4242424242424242424242424242424242424242"
+USDC = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+
+SYMBOL_SELECTOR = bytes.fromhex("95d89b41")
+DECIMALS_SELECTOR = bytes.fromhex("313ce567")
+NAME_SELECTOR = bytes.fromhex("06fdde03")
+
+
+class FakeEth:
+    """Answers raw ERC20 getter eth_calls from a selector -> return data map."""
+
+    def __init__(self, responses: dict):
+        self.responses = responses
+        self.calls = []
+
+    async def call(self, transaction):
+        self.calls.append(transaction)
+        response = self.responses.get(transaction["data"])
+        if response is None:
+            raise ValueError("execution reverted")
+        return response
+
+
+class FakeWeb3:
+    def __init__(self, responses: dict):
+        self.eth = FakeEth(responses)
+
+
+@pytest.fixture
+def service():
+    return TokenMetadataService()
+
+
+@pytest.fixture
+def web3():
+    return FakeWeb3({
+        SYMBOL_SELECTOR: encode(["string"], ["TKN"]),
+        DECIMALS_SELECTOR: encode(["uint8"], [8]),
+        NAME_SELECTOR: encode(["string"], ["Token"]),
+    })
+
+
+class TestToChecksum:
+    def test_matches_eth_utils(self):
+        for raw in [bytes(20), b"\xff" * 20, *(os.urandom(20) for _ in range(200))]:
+            expected = to_checksum_address(raw)
+            assert _to_checksum("0x" + raw.hex()) == expected
+            assert _to_checksum("0x" + raw.hex().upper()) == expected
+            assert _to_checksum(raw.hex()) == expected
+            assert _to_checksum(raw) == expected
+
+    def test_known_token_is_unchanged(self):
+        assert _to_checksum(USDC) == USDC
+
+    @pytest.mark.parametrize(
+        "address",
+        ["0x1234", "0x" + "g" * 40, "0x" + "00" * 21, b"\x00" * 19, b"0x" + b"00" * 20],
+    )
+    def test_invalid_address(self, address):
+        with pytest.raises(ValueError):
+            _to_checksum(address)
+
+    async def test_get_metadata_accepts_bytes(self, service):
+        metadata = await service.get_metadata(bytes.fromhex(USDC[2:]))
+        assert metadata.symbol == "USDC"
+
+
+class TestFetchFromRPC:
+    async def test_raw_eth_call_decoding(self, service, web3):
+        metadata = await service.get_metadata(TOKEN.lower(), web3=web3)
+
+        assert metadata.address == TOKEN
+        assert metadata.symbol == "TKN"
+        assert metadata.decimals == 8
+        assert metadata.name == "Token"
+        assert [call["data"] for call in web3.eth.calls] == [
+            SYMBOL_SELECTOR, DECIMALS_SELECTOR, NAME_SELECTOR,
+        ]
+        assert all(call["to"] == TOKEN for call in web3.eth.calls)
+
+    async def test_name_is_optional(self, service, web3):
+        del web3.eth.responses[NAME_SELECTOR]
+
+        metadata = await service.get_metadata(TOKEN, web3=web3)
+
+        assert metadata.symbol == "TKN"
+        assert metadata.name is None
+
+    async def test_result_is_cached(self, service, web3):
+        first = await service.get_metadata(TOKEN, web3=web3)
+        second = await service.get_metadata(TOKEN.lower(), web3=web3)
+
+        assert second is first
+        assert len(web3.eth.calls) == 3
+
+    async def test_known_token_skips_rpc(self, service, web3):
+        metadata = await service.get_metadata(USDC.lower(), web3=web3)
+
+        assert metadata.symbol == "USDC"
+        assert web3.eth.calls == []
+
+
+class TestNegativeCache:
+    @pytest.fixture
+    def web3(self):
+        return FakeWeb3({})  # every call reverts
+
+    async def test_failed_lookup_is_remembered(self, service, web3):
+        assert await service.get_metadata(TOKEN, web3=web3) is None
+        assert await service.get_metadata(TOKEN, web3=web3) is None
+
+        assert len(web3.eth.calls) == 1
+
+    async def test_retried_after_ttl(self, service, web3):
+        await service.get_metadata(TOKEN, web3=web3)
+        cache_key = service._cache_key(TOKEN, "ethereum")
+        service._neg_cache[cache_key] = time.monotonic() - 1
+
+        assert await service.get_metadata(TOKEN, web3=web3) is None
+
+        assert len(web3.eth.calls) == 2
+        assert service._neg_cache[cache_key] > time.monotonic()
+
+    async def test_expired_entries_purged_when_full(self, service, web3, monkeypatch):
+        monkeypatch.setattr(service, "NEGATIVE_CACHE_MAX_ENTRIES", 2)
+        expired = time.monotonic() - 1
+        service._neg_cache = {"ethereum:stale1": expired, "ethereum:stale2": expired, "ethereum:stale3": expired}
+
+        await service.get_metadata(TOKEN, web3=web3)
+
+        assert list(service._neg_cache) == [service._cache_key(TOKEN, "ethereum")]
+
+    async def test_without_web3_nothing_is_recorded(self, service):
+        assert await service.get_metadata(TOKEN) is None
+        assert service._neg_cache == {}
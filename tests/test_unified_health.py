@@ -23,8 +23,8 @@ def create_position(
         protocol=protocol,
         wallet_address="0x1234567890123456789012345678901234567890",
         health_factor=health_factor,
-        collateral_assets=[],
-        debt_assets=[],
+        collateral_assets=(),
+        debt_assets=(),
         total_collateral_usd=total_collateral_usd,
         total_debt_usd=total_debt_usd,
         liquidation_threshold=liquidation_threshold,
@@ -32,12 +32,40 @@ def create_position(
     )
 
 
+class TestPositionLayout:
+    def test_position_uses_slots(self):
+        position = create_position()
+        assert not hasattr(position, "__dict__")
+
+    def test_asset_lists_become_tuples(self):
+        position = Position(
+            protocol="Test",
+            wallet_address="0x1234567890123456789012345678901234567890",
+            health_factor=2.0,
+            total_collateral_usd=10000.0,
+            total_debt_usd=5000.0,
+            liquidation_threshold=0.8,
+            available_borrows_usd=0.0,
+            collateral_assets=[],
+            debt_assets=[],
+        )
+        assert position.collateral_assets == ()
+        assert position.debt_assets == ()
+        hash(position)
+
+    def test_position_is_frozen(self):
+        position = create_position()
+        with pytest.raises(AttributeError):
+            position.health_factor = 1.0
+
+
 class TestUnifiedHealthScore:
     def test_empty_positions(self):
         unified = calculate_unified_health_score([])
         assert unified.overall_score == 100.0
         assert unified.overall_status == HealthStatus.HEALTHY
         assert unified.worst_position is None
+        assert calculate_unified_health_score([]) is unified
 
     def test_single_healthy_position(self):
         positions = [create_position(health_factor=3.0)]
@@ -109,6 +137,25 @@ class TestUnifiedHealthScore:
         assert unified.total_collateral_usd == 30000.0
         assert unified.total_debt_usd == 13000.0
 
+    def test_protocol_breakdown_is_read_only(self):
+        unified = calculate_unified_health_score([create_position(protocol="Aave V3")])
+
+        with pytest.raises(TypeError):
+            unified.protocol_breakdown["Aave V3"] = 0.5
+
+    def test_large_portfolio(self):
+        positions = [
+            create_position(protocol=f"P{i}", health_factor=2.0 + i / 1000)
+            for i in range(10_000)
+        ]
+        positions.append(create_position(protocol="Worst", health_factor=1.05, total_debt_usd=1.0))
+        unified = calculate_unified_health_score(positions)
+
+        assert unified.worst_position is positions[-1]
+        assert unified.overall_status == HealthStatus.CRITICAL
+        assert unified.total_collateral_usd == 10_001 * 10000.0
+        assert len(unified.protocol_breakdown) == 10_001
+
 
 class TestRepaymentCalculation:
     def test_repayment_for_target_hf(self):
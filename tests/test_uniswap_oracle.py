@@ -0,0 +1,209 @@
+"""Tests for the Uniswap V3 TWAP oracle."""
+
+import pytest
+
+from app.services.uniswap_oracle import UNISWAP_V3_POOLS, UniswapV3Oracle
+
+ETH_PRICE_USD = 2000.0
+
+# Pool reads for a flat market: tick 0 now and over the whole TWAP window,
+# so every token/WETH pool prices at exactly 1 WETH
+SLOT0 = (2**96, 0, 0, 1, 1, 0, True)
+OBSERVATIONS = ([0, 0], [0, 0])
+LIQUIDITY = 10**18
+
+
+class FakeCall:
+    """Prepared pool call that counts direct .call() round trips."""
+
+    def __init__(self, pool, result):
+        self._pool = pool
+        self.result = result
+
+    async def call(self):
+        self._pool.direct_calls += 1
+        return self.result
+
+
+class FakePoolFunctions:
+    def __init__(self, pool):
+        self._pool = pool
+
+    def slot0(self):
+        return FakeCall(self._pool, SLOT0)
+
+    def observe(self, seconds_agos):
+        return FakeCall(self._pool, OBSERVATIONS)
+
+    def liquidity(self):
+        return FakeCall(self._pool, LIQUIDITY)
+
+
+class FakePool:
+    def __init__(self):
+        self.direct_calls = 0
+        self.functions = FakePoolFunctions(self)
+
+
+class FakeBatch:
+    """Stand-in for web3's async request batcher."""
+
+    def __init__(self, web3):
+        self._web3 = web3
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def add(self, call):
+        self.calls.append(call)
+
+    async def async_execute(self):
+        if self._web3.reject_batches:
+            raise ValueError("batch requests not supported")
+        return [call.result for call in self.calls]
+
+
+class FakeEth:
+    def __init__(self):
+        self.block = 100
+        self.block_number_reads = 0
+        self.pools = {}
+
+    @property
+    async def block_number(self):
+        self.block_number_reads += 1
+        return self.block
+
+    def contract(self, address, abi):
+        return self.pools.setdefault(address.lower(), FakePool())
+
+
+class FakeWeb3:
+    def __init__(self):
+        self.eth = FakeEth()
+        self.batches = []
+        self.reject_batches = False
+
+    def batch_requests(self):
+        batch = FakeBatch(self)
+        self.batches.append(batch)
+        return batch
+
+    def pool(self, pair: str) -> FakePool:
+        return self.eth.pools[UNISWAP_V3_POOLS[pair][0].lower()]
+
+
+@pytest.fixture
+def web3():
+    return FakeWeb3()
+
+
+@pytest.fixture
+async def oracle(web3):
+    oracle = UniswapV3Oracle(web3=web3)
+    await oracle.set_eth_price_usd(ETH_PRICE_USD)
+    return oracle
+
+
+class TestTWAPCache:
+    async def test_get_twap(self, oracle):
+        twap = await oracle.get_twap("LINK")
+
+        assert twap.symbol == "LINK"
+        assert twap.price == pytest.approx(ETH_PRICE_USD)
+        assert twap.spot_price == pytest.approx(ETH_PRICE_USD)
+        assert twap.deviation_percent == 0.0
+        assert twap.liquidity == LIQUIDITY
+
+    async def test_unknown_symbol(self, oracle, web3):
+        assert await oracle.get_twap("NOPE") is None
+        assert web3.eth.block_number_reads == 0
+
+    async def test_reused_within_block(self, oracle, web3):
+        first = await oracle.get_twap("LINK")
+        second = await oracle.get_twap("LINK")
+
+        assert web3.pool("LINK-WETH").direct_calls == 3
+        assert second.price == first.price
+        assert second.timestamp >= first.timestamp
+
+    async def test_cache_keyed_on_twap_window(self, oracle, web3):
+        await oracle.get_twap("LINK")
+        await oracle.get_twap("LINK", twap_seconds=60)
+
+        assert web3.pool("LINK-WETH").direct_calls == 6
+
+    async def test_block_number_reused_within_ttl(self, oracle, web3):
+        await oracle.get_twap("LINK")
+        await oracle.get_twap("UNI")
+
+        assert web3.eth.block_number_reads == 1
+
+    async def test_new_block_after_ttl_refetches(self, oracle, web3):
+        await oracle.get_twap("LINK")
+
+        # Still within the TTL: the new block is not seen yet
+        web3.eth.block = 101
+        await oracle.get_twap("LINK")
+        assert web3.pool("LINK-WETH").direct_calls == 3
+
+        oracle._block_number_fetched_at -= oracle.BLOCK_NUMBER_TTL_SECONDS + 1
+        await oracle.get_twap("LINK")
+
+        assert web3.eth.block_number_reads == 2
+        assert web3.pool("LINK-WETH").direct_calls == 6
+
+    async def test_cache_evicts_least_recently_used(self, oracle, monkeypatch):
+        monkeypatch.setattr(oracle, "TWAP_CACHE_SIZE", 2)
+
+        await oracle.get_twap("LINK")
+        await oracle.get_twap("UNI")
+        await oracle.get_twap("LINK")  # refreshes LINK
+        await oracle.get_twap("AAVE")
+
+        assert [key[0] for key in oracle._twap_cache] == ["LINK", "AAVE"]
+
+
+class TestGetTWAPMany:
+    async def test_single_batch(self, oracle, web3):
+        twaps = await oracle.get_twap_many(["LINK", "NOPE", "UNI"])
+
+        assert len(web3.batches) == 1
+        assert len(web3.batches[0].calls) == 6  # slot0, observe, liquidity per pool
+        assert [twap and twap.symbol for twap in twaps] == ["LINK", None, "UNI"]
+        assert twaps[0].price == pytest.approx(ETH_PRICE_USD)
+        assert web3.pool("LINK-WETH").direct_calls == 0
+
+    async def test_results_are_cached(self, oracle, web3):
+        await oracle.get_twap_many(["LINK", "UNI"])
+        twap = await oracle.get_twap("LINK")
+
+        assert twap.symbol == "LINK"
+        assert web3.pool("LINK-WETH").direct_calls == 0
+
+    async def test_cached_symbols_skip_batch(self, oracle, web3):
+        await oracle.get_twap("LINK")
+        twaps = await oracle.get_twap_many(["LINK", "UNI"])
+
+        assert len(web3.batches[0].calls) == 3
+        assert [twap.symbol for twap in twaps] == ["LINK", "UNI"]
+
+    async def test_all_cached_sends_nothing(self, oracle, web3):
+        await oracle.get_twap("LINK")
+        twaps = await oracle.get_twap_many(["LINK"])
+
+        assert web3.batches[0].calls == []
+        assert twaps[0].symbol == "LINK"
+
+    async def test_falls_back_to_get_twap(self, oracle, web3):
+        web3.reject_batches = True
+
+        twaps = await oracle.get_twap_many(["LINK", "NOPE", "UNI"])
+
+        assert [twap and twap.symbol for twap in twaps] == ["LINK", None, "UNI"]
+        assert web3.pool("LINK-WETH").direct_calls == 3
+        assert web3.pool("UNI-WETH").direct_calls == 3